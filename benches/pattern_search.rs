@@ -5,6 +5,7 @@
 
 use criterion::{BenchmarkId, Criterion, Throughput, black_box, criterion_group, criterion_main};
 use libmemscan::scanner::{naive_search, optimized_search};
+use libmemscan::simd::find_pattern;
 
 fn benchmark_pattern_search(c: &mut Criterion) {
     let mut group = c.benchmark_group("pattern_search");
@@ -194,11 +195,40 @@ fn benchmark_optimized_search_realistic(c: &mut Criterion) {
     group.finish();
 }
 
+fn benchmark_find_pattern(c: &mut Criterion) {
+    let mut group = c.benchmark_group("find_pattern");
+
+    // Same inputs as the optimized_search miss cases, but reporting every match
+    for size in [1024, 4096, 16384, 65536].iter() {
+        let haystack = vec![0u8; *size];
+        let pattern_short = b"MZ";
+        let pattern_medium = b"\x4D\x5A\x90\x00";
+        let pattern_long = b"\x4D\x5A\x90\x00\x03\x00\x00\x00\x04\x00\x00\x00";
+
+        group.throughput(Throughput::Bytes(*size as u64));
+
+        group.bench_with_input(BenchmarkId::new("miss_short", size), size, |b, &_size| {
+            b.iter(|| find_pattern(black_box(&haystack), black_box(pattern_short)));
+        });
+
+        group.bench_with_input(BenchmarkId::new("miss_medium", size), size, |b, &_size| {
+            b.iter(|| find_pattern(black_box(&haystack), black_box(pattern_medium)));
+        });
+
+        group.bench_with_input(BenchmarkId::new("miss_long", size), size, |b, &_size| {
+            b.iter(|| find_pattern(black_box(&haystack), black_box(pattern_long)));
+        });
+    }
+
+    group.finish();
+}
+
 criterion_group!(
     benches,
     benchmark_pattern_search,
     benchmark_pattern_search_realistic,
     benchmark_optimized_search,
-    benchmark_optimized_search_realistic
+    benchmark_optimized_search_realistic,
+    benchmark_find_pattern
 );
 criterion_main!(benches);
@@ -6,10 +6,97 @@ This example demonstrates how to use the memscan Python bindings to perform
 interactive memory scanning on a target process.
 """
 
+import itertools
 import memscan
+import sys
 import time
 
 
+MENU = "\n".join([
+    "",
+    "Available operations:",
+    "  1. Filter by exact value (eq)",
+    "  2. Filter by less than (lt)",
+    "  3. Filter by greater than (gt)",
+    "  4. Filter by increased",
+    "  5. Filter by decreased",
+    "  6. Filter by changed",
+    "  7. Filter by unchanged",
+    "  8. List matches (first 20)",
+    "  9. Set value at all matches",
+    "  10. Save checkpoint",
+    "  11. List checkpoints",
+    "  0. Exit",
+]) + "\n"
+
+
+def read_value(scanner, prompt):
+    """Read a value as an int for integer scanners and as a float otherwise"""
+    parser = int if scanner.value_type[0] in "iu" else float
+    return parser(input(prompt))
+
+
+def filter_by_value(method):
+    """Menu action: read a value and apply a comparison filter"""
+    def action(scanner):
+        value = read_value(scanner, "Enter value: ")
+        count = method(scanner, value)
+        print(f"Filtered to {count} addresses")
+    return action
+
+
+def filter_by_change(method):
+    """Menu action: apply a filter relative to the previous scan"""
+    def action(scanner):
+        count = method(scanner)
+        print(f"Filtered to {count} addresses")
+    return action
+
+
+def list_matches(scanner):
+    print(f"\nShowing first 20 of {scanner.match_count()} matches:")
+    for i, match in enumerate(itertools.islice(scanner.iter_matches(), 20)):
+        print(f"  {i}: {match}")
+
+
+def set_value(scanner):
+    value = read_value(scanner, "Enter value to set: ")
+    count = scanner.set_value(value)
+    print(f"Set value at {count} addresses")
+
+
+def save_checkpoint(scanner):
+    name = input("Enter checkpoint name: ")
+    scanner.save_checkpoint(name)
+    print(f"Checkpoint '{name}' saved")
+
+
+def list_checkpoints(scanner):
+    checkpoints = scanner.list_checkpoints()
+    print(f"Saved checkpoints: {checkpoints}")
+
+
+def invalid_choice(scanner):
+    print("Invalid choice")
+
+
+Scanner = memscan.PyInteractiveScanner
+
+ACTIONS = {
+    "1": filter_by_value(Scanner.filter_eq),
+    "2": filter_by_value(Scanner.filter_lt),
+    "3": filter_by_value(Scanner.filter_gt),
+    "4": filter_by_change(Scanner.filter_increased),
+    "5": filter_by_change(Scanner.filter_decreased),
+    "6": filter_by_change(Scanner.filter_changed),
+    "7": filter_by_change(Scanner.filter_unchanged),
+    "8": list_matches,
+    "9": set_value,
+    "10": save_checkpoint,
+    "11": list_checkpoints,
+}
+
+
 def find_value_example():
     """Example: Find and modify a specific value in a process"""
 
@@ -47,67 +134,12 @@ def find_value_example():
 
     # Interactive filtering
     while True:
-        print(f"\nCurrent matches: {scanner.match_count()}")
-        print("\nAvailable operations:")
-        print("  1. Filter by exact value (eq)")
-        print("  2. Filter by less than (lt)")
-        print("  3. Filter by greater than (gt)")
-        print("  4. Filter by increased")
-        print("  5. Filter by decreased")
-        print("  6. Filter by changed")
-        print("  7. Filter by unchanged")
-        print("  8. List matches (first 20)")
-        print("  9. Set value at all matches")
-        print("  10. Save checkpoint")
-        print("  11. List checkpoints")
-        print("  0. Exit")
+        sys.stdout.write(f"\nCurrent matches: {scanner.match_count()}\n{MENU}")
 
         choice = input("\nEnter choice: ").strip()
-
         if choice == "0":
             break
-        elif choice == "1":
-            value = float(input("Enter value: "))
-            count = scanner.filter_eq(value)
-            print(f"Filtered to {count} addresses")
-        elif choice == "2":
-            value = float(input("Enter value: "))
-            count = scanner.filter_lt(value)
-            print(f"Filtered to {count} addresses")
-        elif choice == "3":
-            value = float(input("Enter value: "))
-            count = scanner.filter_gt(value)
-            print(f"Filtered to {count} addresses")
-        elif choice == "4":
-            count = scanner.filter_increased()
-            print(f"Filtered to {count} addresses")
-        elif choice == "5":
-            count = scanner.filter_decreased()
-            print(f"Filtered to {count} addresses")
-        elif choice == "6":
-            count = scanner.filter_changed()
-            print(f"Filtered to {count} addresses")
-        elif choice == "7":
-            count = scanner.filter_unchanged()
-            print(f"Filtered to {count} addresses")
-        elif choice == "8":
-            matches = scanner.get_matches()
-            print(f"\nShowing first 20 of {len(matches)} matches:")
-            for i, match in enumerate(matches[:20]):
-                print(f"  {i}: {match}")
-        elif choice == "9":
-            value = float(input("Enter value to set: "))
-            count = scanner.set_value(value)
-            print(f"Set value at {count} addresses")
-        elif choice == "10":
-            name = input("Enter checkpoint name: ")
-            scanner.save_checkpoint(name)
-            print(f"Checkpoint '{name}' saved")
-        elif choice == "11":
-            checkpoints = scanner.list_checkpoints()
-            print(f"Saved checkpoints: {checkpoints}")
-        else:
-            print("Invalid choice")
+        ACTIONS.get(choice, invalid_choice)(scanner)
 
 
 def pattern_scan_example():
@@ -137,7 +169,7 @@ def pattern_scan_example():
     try:
         data = memscan.read_process_memory(proc, address, size)
         print(f"Read {len(data)} bytes:")
-        print(" ".join(f"{b:02x}" for b in data))
+        print(data.hex(" "))
     except Exception as e:
         print(f"Failed to read memory: {e}")
 
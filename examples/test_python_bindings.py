@@ -4,6 +4,7 @@ Simple test script to verify Python bindings are working correctly.
 This tests basic functionality without requiring a running process.
 """
 
+import os
 import sys
 
 def test_imports():
@@ -28,9 +29,18 @@ def test_module_exports():
         'query_system_info',
         'get_process_module_regions',
         'parse_hex_pattern',
+        'parse_hex_pattern_masked',
         'read_process_memory',
         'write_process_memory',
         'create_interactive_scanner',
+        'match_values',
+        'match_addresses',
+        'scanned_values',
+        'filter_eq_bulk',
+        'filter_lt_bulk',
+        'filter_gt_bulk',
+        'filter_increased_bulk',
+        'filter_decreased_bulk',
     ]
     
     expected_classes = [
@@ -39,6 +49,7 @@ def test_module_exports():
         'PySystemInfo',
         'PyInteractiveScanner',
         'PyMatchedAddress',
+        'PyMatchIter',
     ]
     
     all_passed = True
@@ -77,6 +88,13 @@ def test_system_info():
             else:
                 print(f"✗ Missing attribute '{attr}'")
                 return False
+
+        # System info is queried once and then cached
+        if memscan.query_system_info() is sys_info:
+            print("✓ query_system_info returned the cached object")
+        else:
+            print("✗ query_system_info queried the system again")
+            return False
         
         return True
     except Exception as e:
@@ -117,6 +135,18 @@ def test_hex_pattern_parsing():
         except Exception:
             print(f"✓ Pattern '{pattern}' correctly rejected")
     
+    # Test wildcard patterns
+    try:
+        data, mask = memscan.parse_hex_pattern_masked("4D ?? 90 ??")
+        if list(data) == [0x4D, 0x00, 0x90, 0x00] and list(mask) == [0xFF, 0x00, 0xFF, 0x00]:
+            print("✓ Wildcard pattern '4D ?? 90 ??' parsed correctly")
+        else:
+            print(f"✗ Wildcard pattern parsed incorrectly: got {list(data)}, {list(mask)}")
+            all_passed = False
+    except Exception as e:
+        print(f"✗ Failed to parse wildcard pattern: {e}")
+        all_passed = False
+    
     return all_passed
 
 def test_find_process():
@@ -131,11 +161,58 @@ def test_find_process():
             print("✓ find_process_by_name returned None (process not found)")
         else:
             print(f"✓ find_process_by_name found process with PID: {pid}")
-        return True
     except Exception as e:
         print(f"✗ find_process_by_name raised exception: {e}")
         return False
 
+    # Repeated lookups within the TTL reuse the cached PID
+    name = os.path.basename(sys.executable)
+    first = memscan.find_process_by_name(name)
+    if first is not None and memscan.find_process_by_name(name) == first:
+        print(f"✓ Repeated lookup of '{name}' returned the cached PID {first}")
+    elif first is None:
+        print(f"✓ '{name}' not found by name, skipping cache check")
+    else:
+        print(f"✗ Repeated lookup of '{name}' returned a different PID")
+        return False
+    return True
+
+def test_bulk_filter_saturation():
+    """Test that bulk filters saturate out-of-range operands like the scalar filters"""
+    print("\nTesting bulk filter operand saturation...")
+    import memscan
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("✓ NumPy not installed, skipping bulk filter check")
+        return True
+
+    proc = memscan.open_process(os.getpid())
+    modules = memscan.get_process_module_regions(proc)
+
+    all_passed = True
+    for value_type, op, operand in [("u8", "lt", 256), ("u8", "gt", -1), ("i32", "eq", 2**31)]:
+        scalar = memscan.create_interactive_scanner(proc, modules, value_type)
+        bulk = memscan.create_interactive_scanner(proc, modules, value_type)
+        scalar.initial_scan_eq(7)
+        bulk.initial_scan_eq(7)
+
+        try:
+            expected = getattr(scalar, f"filter_{op}")(operand)
+            got = getattr(memscan, f"filter_{op}_bulk")(bulk, operand)
+        except Exception as e:
+            print(f"✗ filter_{op}({operand}) on {value_type} raised: {e}")
+            all_passed = False
+            continue
+
+        if got == expected:
+            print(f"✓ filter_{op}_bulk({operand}) on {value_type} kept {got} matches, like filter_{op}")
+        else:
+            print(f"✗ filter_{op}_bulk({operand}) on {value_type} kept {got} matches, filter_{op} kept {expected}")
+            all_passed = False
+    return all_passed
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -148,6 +225,7 @@ def main():
         ("System Info", test_system_info),
         ("Hex Pattern Parsing", test_hex_pattern_parsing),
         ("Process Finding", test_find_process),
+        ("Bulk Filter Saturation", test_bulk_filter_saturation),
     ]
     
     results = []
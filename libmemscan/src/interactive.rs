@@ -5,12 +5,17 @@
 //! until only a few candidates remain.
 
 use crate::diff::MemoryDiff;
-use crate::process::{MemoryRegion, ProcessHandle, write_process_memory};
+use crate::memmap::MappedMemory;
+use crate::process::{
+    MemoryRegion, ProcessHandle, write_process_memory, write_process_memory_batch,
+};
+use crate::simd;
 use crate::values::{
     MathOp, Value, ValueType, apply_math_op, value_greater_than, value_less_than, value_subtract,
     values_equal,
 };
 use anyhow::Result;
+use rayon::prelude::*;
 use std::collections::HashMap;
 
 /// Filter operation for comparing values
@@ -52,6 +57,83 @@ pub struct MatchedAddress {
     pub previous_value: Option<Value>,
 }
 
+/// Matched addresses stored as parallel columns (struct of arrays)
+///
+/// Filter passes only touch one column at a time, so addresses and values are
+/// kept in separate contiguous buffers instead of a `Vec<MatchedAddress>`.
+/// Values are packed little-endian with one `value_type.size()` slot per
+/// match, the layout the [`simd`] kernels and the bulk filters work on.
+#[derive(Debug, Clone, Default)]
+struct MatchColumns {
+    /// Address of each match
+    addresses: Vec<usize>,
+    /// Value recorded for each match by the last scan or filter step
+    values: Vec<u8>,
+    /// Value recorded by the step before that (empty after an initial scan)
+    previous: Vec<u8>,
+}
+
+impl MatchColumns {
+    /// Concatenate per-region columns in order
+    fn concat(parts: Vec<MatchColumns>) -> Self {
+        let mut columns = MatchColumns::default();
+        for mut part in parts {
+            columns.addresses.append(&mut part.addresses);
+            columns.values.append(&mut part.values);
+        }
+        columns
+    }
+
+    fn len(&self) -> usize {
+        self.addresses.len()
+    }
+
+    fn is_empty(&self) -> bool {
+        self.addresses.is_empty()
+    }
+
+    fn clear(&mut self) {
+        self.addresses.clear();
+        self.values.clear();
+        self.previous.clear();
+    }
+
+    /// Packed value slot of the match at `index`
+    fn value_bytes(&self, index: usize, width: usize) -> &[u8] {
+        &self.values[index * width..(index + 1) * width]
+    }
+
+    /// Value recorded for the match at `index`
+    fn value(&self, index: usize, value_type: ValueType) -> Value {
+        Value::from_bytes(&self.values, index * value_type.size(), value_type)
+            .expect("value column has a slot for every match")
+    }
+
+    /// Build the match at `index`
+    fn get(&self, index: usize, value_type: ValueType) -> MatchedAddress {
+        let offset = index * value_type.size();
+        MatchedAddress {
+            address: self.addresses[index],
+            current_value: self.value(index, value_type),
+            previous_value: Value::from_bytes(&self.previous, offset, value_type),
+        }
+    }
+
+    /// Keep the matches at `kept` (increasing indices) with the freshly read
+    /// `values` (one slot per kept match); their old values become `previous`.
+    fn advance(&mut self, kept: &[usize], values: Vec<u8>, width: usize) {
+        let mut addresses = Vec::with_capacity(kept.len());
+        let mut previous = Vec::with_capacity(kept.len() * width);
+        for &index in kept {
+            addresses.push(self.addresses[index]);
+            previous.extend_from_slice(self.value_bytes(index, width));
+        }
+        self.addresses = addresses;
+        self.previous = previous;
+        self.values = values;
+    }
+}
+
 /// Interactive memory scanner that maintains state between scans
 pub struct InteractiveScanner<'a> {
     /// Target process handle
@@ -59,7 +141,7 @@ pub struct InteractiveScanner<'a> {
     /// Memory diff tracker for managing snapshots and regions
     diff: MemoryDiff<'a>,
     /// Matched addresses from current filter
-    matches: Vec<MatchedAddress>,
+    matches: MatchColumns,
     /// Value type being searched for
     value_type: ValueType,
     /// Alignment requirement (1, 2, 4, or 8 bytes)
@@ -78,14 +160,12 @@ impl<'a> InteractiveScanner<'a> {
         let mut diff = MemoryDiff::new(process);
 
         // Map all regions using MemoryDiff's mapper
-        for region in regions {
-            let _ = diff.mapper.map_region(region);
-        }
+        diff.mapper.map_regions(regions);
 
         Self {
             process,
             diff,
-            matches: Vec::new(),
+            matches: MatchColumns::default(),
             value_type,
             alignment: value_type.size(), // Default to natural alignment
             checkpoints: HashMap::new(),
@@ -98,30 +178,46 @@ impl<'a> InteractiveScanner<'a> {
     }
 
     /// Perform initial scan to find all possible addresses
+    ///
+    /// Regions are scanned in parallel; matches keep the region iteration order.
     pub fn initial_scan(&mut self) -> Result<usize> {
-        self.matches.clear();
+        let value_type = self.value_type;
+        let alignment = self.alignment;
 
         // Use mapped memory from the diff tracker
-        for mapped in self.diff.mapper.iter() {
-            let base_address = mapped.remote_region.base_address;
-            let data = mapped.data();
-
-            // Scan through the region with proper alignment
-            let mut offset = 0;
-            while offset + self.value_type.size() <= data.len() {
-                if offset % self.alignment == 0 {
-                    if let Some(value) = Value::from_bytes(data, offset, self.value_type) {
-                        self.matches.push(MatchedAddress {
-                            address: base_address + offset,
-                            current_value: value,
-                            previous_value: None,
-                        });
-                    }
-                }
-                offset += self.alignment;
-            }
+        let regions: Vec<&MappedMemory> = self.diff.mapper.iter().collect();
+        let per_region: Vec<MatchColumns> = regions
+            .par_iter()
+            .map(|mapped| scan_region_all(mapped, value_type, alignment))
+            .collect();
+
+        self.matches = MatchColumns::concat(per_region);
+        Ok(self.matches.len())
+    }
+
+    /// Perform an initial scan that only keeps addresses currently holding `value`.
+    ///
+    /// Equivalent to `initial_scan` followed by an `Equals` filter, but without
+    /// materializing a match for every address first. Regions are scanned in
+    /// parallel and naturally aligned integer scans use the SIMD
+    /// [`simd::find_equal`] kernel.
+    pub fn initial_scan_eq(&mut self, value: Value) -> Result<usize> {
+        if value.value_type() != self.value_type {
+            anyhow::bail!(
+                "Value type mismatch: scanning for {:?}, got {:?}",
+                self.value_type,
+                value.value_type()
+            );
         }
 
+        let alignment = self.alignment;
+        let regions: Vec<&MappedMemory> = self.diff.mapper.iter().collect();
+        let per_region: Vec<MatchColumns> = regions
+            .par_iter()
+            .map(|mapped| scan_region_eq(mapped, &value, alignment))
+            .collect();
+
+        self.matches = MatchColumns::concat(per_region);
         Ok(self.matches.len())
     }
 
@@ -135,24 +231,25 @@ impl<'a> InteractiveScanner<'a> {
 
     /// Apply a filter to the current matches
     pub fn filter(&mut self, op: FilterOp, compare_value: Option<Value>) -> Result<usize> {
-        let mut new_matches = Vec::new();
+        self.diff.mapper.refresh();
 
-        for match_entry in &self.matches {
-            // Find the mapped region containing this address
-            let mapped = self.diff.mapper.get_by_address(match_entry.address);
-
-            if mapped.is_none() {
-                continue; // Region no longer mapped
-            }
+        // Bitwise equality is only equivalent to value equality for integers
+        // (floats have NaN and signed zero), so floats take the generic path.
+        if matches!(op, FilterOp::Changed | FilterOp::Unchanged) && !self.value_type.is_float() {
+            return self.filter_changed_packed(op == FilterOp::Unchanged);
+        }
 
-            let mapped = mapped.unwrap();
-            let offset = match_entry.address - mapped.remote_region.base_address;
-            let data = mapped.data();
+        let width = self.value_type.size();
+        let mut kept = Vec::new();
+        let mut values = Vec::new();
 
-            // Read current value from mapped memory
-            let current = match Value::from_bytes(data, offset, self.value_type) {
-                Some(v) => v,
-                None => continue,
+        for (index, &address) in self.matches.addresses.iter().enumerate() {
+            // Read current value from mapped memory (skip if region no longer mapped)
+            let Some(bytes) = self.read_current_bytes(address) else {
+                continue;
+            };
+            let Some(current) = Value::from_bytes(bytes, 0, self.value_type) else {
+                continue;
             };
 
             let keep = match op {
@@ -177,22 +274,27 @@ impl<'a> InteractiveScanner<'a> {
                         false
                     }
                 }
-                FilterOp::Increased => value_greater_than(&current, &match_entry.current_value),
-                FilterOp::Decreased => value_less_than(&current, &match_entry.current_value),
-                FilterOp::Changed => !values_equal(&current, &match_entry.current_value),
-                FilterOp::Unchanged => values_equal(&current, &match_entry.current_value),
+                FilterOp::Increased => {
+                    value_greater_than(&current, &self.matches.value(index, self.value_type))
+                }
+                FilterOp::Decreased => {
+                    value_less_than(&current, &self.matches.value(index, self.value_type))
+                }
+                FilterOp::Changed => {
+                    !values_equal(&current, &self.matches.value(index, self.value_type))
+                }
+                FilterOp::Unchanged => {
+                    values_equal(&current, &self.matches.value(index, self.value_type))
+                }
             };
 
             if keep {
-                new_matches.push(MatchedAddress {
-                    address: match_entry.address,
-                    current_value: current,
-                    previous_value: Some(match_entry.current_value.clone()),
-                });
+                kept.push(index);
+                values.extend_from_slice(bytes);
             }
         }
 
-        self.matches = new_matches;
+        self.matches.advance(&kept, values, width);
 
         // Clean up regions with no matches
         self.cleanup_empty_regions();
@@ -200,6 +302,128 @@ impl<'a> InteractiveScanner<'a> {
         Ok(self.matches.len())
     }
 
+    /// Changed/unchanged filter over packed columns.
+    ///
+    /// The recorded value column is compared against a freshly read column of
+    /// current values with a SIMD kernel, instead of comparing one `Value` at
+    /// a time.
+    fn filter_changed_packed(&mut self, keep_unchanged: bool) -> Result<usize> {
+        let width = self.value_type.size();
+        let mut current = Vec::with_capacity(self.matches.values.len());
+        // Column slot -> match index (unreadable matches are dropped)
+        let mut slots = Vec::with_capacity(self.matches.len());
+
+        for (index, &address) in self.matches.addresses.iter().enumerate() {
+            if let Some(bytes) = self.read_current_bytes(address) {
+                current.extend_from_slice(bytes);
+                slots.push(index);
+            }
+        }
+
+        // Only gather the recorded values when some matches were dropped
+        let survivors = if slots.len() == self.matches.len() {
+            simd::select_equal(&self.matches.values, &current, width, keep_unchanged)
+        } else {
+            let mut recorded = Vec::with_capacity(current.len());
+            for &index in &slots {
+                recorded.extend_from_slice(self.matches.value_bytes(index, width));
+            }
+            simd::select_equal(&recorded, &current, width, keep_unchanged)
+        };
+
+        let mut kept = Vec::with_capacity(survivors.len());
+        let mut values = Vec::with_capacity(survivors.len() * width);
+        for slot in survivors {
+            let slot = slot as usize;
+            kept.push(slots[slot]);
+            values.extend_from_slice(&current[slot * width..(slot + 1) * width]);
+        }
+
+        self.matches.advance(&kept, values, width);
+        self.cleanup_empty_regions();
+
+        Ok(self.matches.len())
+    }
+
+    /// Pack the current value of every match into a contiguous little-endian
+    /// buffer with one `value_type.size()` slot per match, in match order.
+    ///
+    /// This is the input for bulk (vectorized) filters that compute the
+    /// surviving indices outside of the scanner and hand them back through
+    /// [`InteractiveScanner::retain_indices`]. Matches whose region is no longer
+    /// mapped keep their last known value so slots stay aligned with `matches()`.
+    pub fn current_values_packed(&mut self) -> Vec<u8> {
+        self.diff.mapper.refresh();
+
+        let width = self.value_type.size();
+        let mut packed = Vec::with_capacity(self.matches.values.len());
+        for (index, &address) in self.matches.addresses.iter().enumerate() {
+            match self.read_current_bytes(address) {
+                Some(bytes) => packed.extend_from_slice(bytes),
+                None => packed.extend_from_slice(self.matches.value_bytes(index, width)),
+            }
+        }
+        packed
+    }
+
+    /// Pack the values recorded for every match by the last scan or filter step,
+    /// i.e. the values that `Increased`/`Decreased`/`Changed` compare against,
+    /// in the same layout as [`InteractiveScanner::current_values_packed`].
+    pub fn scanned_values_packed(&self) -> Vec<u8> {
+        self.matches.values.clone()
+    }
+
+    /// Keep only the matches at the given indices, as if they had passed a filter.
+    ///
+    /// Indices refer to positions in `matches()` (and thus slots in
+    /// `current_values_packed()`) and must be strictly increasing. Retained
+    /// matches record the values read by that call, which the indices were
+    /// computed from.
+    pub fn retain_indices(&mut self, indices: &[u32]) -> Result<usize> {
+        let width = self.value_type.size();
+        let mut kept = Vec::with_capacity(indices.len());
+        let mut values = Vec::with_capacity(indices.len() * width);
+        let mut last_index = None;
+
+        for &index in indices {
+            let index = index as usize;
+            if last_index.is_some_and(|last| index <= last) {
+                anyhow::bail!("Match indices must be strictly increasing");
+            }
+            last_index = Some(index);
+
+            let address = *self.matches.addresses.get(index).ok_or_else(|| {
+                anyhow::anyhow!(
+                    "Match index {} out of range ({} matches)",
+                    index,
+                    self.matches.len()
+                )
+            })?;
+
+            if let Some(bytes) = self.read_current_bytes(address) {
+                kept.push(index);
+                values.extend_from_slice(bytes);
+            }
+        }
+
+        self.matches.advance(&kept, values, width);
+        self.cleanup_empty_regions();
+
+        Ok(self.matches.len())
+    }
+
+    /// Read the current value at an address from mapped memory
+    fn read_current(&self, address: usize) -> Option<Value> {
+        Value::from_bytes(self.read_current_bytes(address)?, 0, self.value_type)
+    }
+
+    /// Get the raw bytes of the current value at an address from mapped memory
+    fn read_current_bytes(&self, address: usize) -> Option<&[u8]> {
+        let mapped = self.diff.mapper.get_by_address(address)?;
+        let offset = address - mapped.remote_region.base_address;
+        mapped.data().get(offset..offset + self.value_type.size())
+    }
+
     /// Remove regions that have no matching addresses
     fn cleanup_empty_regions(&mut self) {
         if self.matches.is_empty() {
@@ -209,8 +433,8 @@ impl<'a> InteractiveScanner<'a> {
 
         // Determine which regions still have matches using MemoryRegion::is_superset_of
         let mut active_addresses = std::collections::HashSet::new();
-        for match_entry in &self.matches {
-            active_addresses.insert(match_entry.address);
+        for &address in &self.matches.addresses {
+            active_addresses.insert(address);
         }
 
         // Remove regions that don't contain any active addresses
@@ -240,14 +464,36 @@ impl<'a> InteractiveScanner<'a> {
     }
 
     /// Write a value to all matched addresses
+    ///
+    /// All addresses are written in one batch (see [`write_process_memory_batch`])
+    /// rather than with one write per match.
     pub fn write_all(&self, value: Value) -> Result<usize> {
-        let mut written = 0;
-        for match_entry in &self.matches {
-            if self.write_value(match_entry.address, value.clone()).is_ok() {
-                written += 1;
-            }
+        Ok(write_process_memory_batch(
+            self.process,
+            &self.matches.addresses,
+            &value.to_bytes(),
+        ))
+    }
+
+    /// Write a value to the matches at the given indices (positions in `matches()`)
+    pub fn write_indices(&self, indices: &[usize], value: Value) -> Result<usize> {
+        let mut addresses = Vec::with_capacity(indices.len());
+        for &index in indices {
+            let address = *self.matches.addresses.get(index).ok_or_else(|| {
+                anyhow::anyhow!(
+                    "Match index {} out of range ({} matches)",
+                    index,
+                    self.matches.len()
+                )
+            })?;
+            addresses.push(address);
         }
-        Ok(written)
+
+        Ok(write_process_memory_batch(
+            self.process,
+            &addresses,
+            &value.to_bytes(),
+        ))
     }
 
     /// Apply a math operation to a specific address
@@ -272,20 +518,35 @@ impl<'a> InteractiveScanner<'a> {
     /// Apply a math operation to all matched addresses
     pub fn modify_all(&self, op: MathOp, operand: Value) -> Result<usize> {
         let mut modified = 0;
-        for match_entry in &self.matches {
-            if self
-                .modify_value(match_entry.address, op, operand.clone())
-                .is_ok()
-            {
+        for &address in &self.matches.addresses {
+            if self.modify_value(address, op, operand.clone()).is_ok() {
                 modified += 1;
             }
         }
         Ok(modified)
     }
 
-    /// Get the current matches
-    pub fn matches(&self) -> &[MatchedAddress] {
-        &self.matches
+    /// Iterate over the current matches.
+    ///
+    /// Matches are stored column-wise, so each `MatchedAddress` is built on
+    /// demand; use [`InteractiveScanner::match_count`] to only count them.
+    pub fn matches(&self) -> impl ExactSizeIterator<Item = MatchedAddress> + '_ {
+        (0..self.matches.len()).map(|index| self.matches.get(index, self.value_type))
+    }
+
+    /// Get the match at `index`, in match order
+    pub fn match_at(&self, index: usize) -> Option<MatchedAddress> {
+        (index < self.matches.len()).then(|| self.matches.get(index, self.value_type))
+    }
+
+    /// Get the number of current matches
+    pub fn match_count(&self) -> usize {
+        self.matches.len()
+    }
+
+    /// Get the addresses of the current matches, in match order
+    pub fn match_addresses(&self) -> &[usize] {
+        &self.matches.addresses
     }
 
     /// Get the current value type being scanned
@@ -310,19 +571,13 @@ impl<'a> InteractiveScanner<'a> {
 
     /// Save a checkpoint with the current memory state
     pub fn save_checkpoint(&mut self, name: String) -> Result<()> {
+        self.diff.mapper.refresh();
         let mut values = HashMap::new();
 
         // Read current values for all matched addresses
-        for match_entry in &self.matches {
-            let mapped = self.diff.mapper.get_by_address(match_entry.address);
-
-            if let Some(mapped) = mapped {
-                let offset = match_entry.address - mapped.remote_region.base_address;
-                let data = mapped.data();
-
-                if let Some(value) = Value::from_bytes(data, offset, self.value_type) {
-                    values.insert(match_entry.address, value);
-                }
+        for &address in &self.matches.addresses {
+            if let Some(value) = self.read_current(address) {
+                values.insert(address, value);
             }
         }
 
@@ -355,6 +610,7 @@ impl<'a> InteractiveScanner<'a> {
         cp3_name: &str,
         margin_percent: f64,
     ) -> Result<usize> {
+        self.diff.mapper.refresh();
         let cp1 = self
             .get_checkpoint(cp1_name)
             .ok_or_else(|| anyhow::anyhow!("Checkpoint '{}' not found", cp1_name))?;
@@ -365,11 +621,11 @@ impl<'a> InteractiveScanner<'a> {
             .get_checkpoint(cp3_name)
             .ok_or_else(|| anyhow::anyhow!("Checkpoint '{}' not found", cp3_name))?;
 
-        let mut new_matches = Vec::new();
-
-        for match_entry in &self.matches {
-            let addr = match_entry.address;
+        let width = self.value_type.size();
+        let mut kept = Vec::new();
+        let mut values = Vec::new();
 
+        for (index, &addr) in self.matches.addresses.iter().enumerate() {
             // Get values from all three checkpoints
             let v1 = match cp1.values.get(&addr) {
                 Some(v) => v,
@@ -397,29 +653,80 @@ impl<'a> InteractiveScanner<'a> {
             // Check if deltas are approximately equal within margin
             if values_within_margin(&delta1, &delta2, margin_percent) {
                 // Read current value
-                let mapped = self.diff.mapper.get_by_address(addr);
-                if let Some(mapped) = mapped {
-                    let offset = addr - mapped.remote_region.base_address;
-                    let data = mapped.data();
-
-                    if let Some(current) = Value::from_bytes(data, offset, self.value_type) {
-                        new_matches.push(MatchedAddress {
-                            address: addr,
-                            current_value: current,
-                            previous_value: Some(match_entry.current_value.clone()),
-                        });
-                    }
+                if let Some(bytes) = self.read_current_bytes(addr) {
+                    kept.push(index);
+                    values.extend_from_slice(bytes);
                 }
             }
         }
 
-        self.matches = new_matches;
+        self.matches.advance(&kept, values, width);
         self.cleanup_empty_regions();
 
         Ok(self.matches.len())
     }
 }
 
+/// Collect every aligned value in a mapped region as a match
+fn scan_region_all(mapped: &MappedMemory, value_type: ValueType, alignment: usize) -> MatchColumns {
+    let base_address = mapped.remote_region.base_address;
+    let data = mapped.data();
+    let size = value_type.size();
+    let mut matches = MatchColumns::default();
+
+    // Naturally aligned slots tile the region, so the value column is the data itself
+    if alignment == size {
+        let count = data.len() / size;
+        matches.addresses = (0..count).map(|i| base_address + i * size).collect();
+        matches.values = data[..count * size].to_vec();
+        return matches;
+    }
+
+    // Scan through the region with proper alignment
+    let mut offset = 0;
+    while offset + size <= data.len() {
+        matches.addresses.push(base_address + offset);
+        matches
+            .values
+            .extend_from_slice(&data[offset..offset + size]);
+        offset += alignment;
+    }
+    matches
+}
+
+/// Collect the aligned addresses in a mapped region that hold `value`
+fn scan_region_eq(mapped: &MappedMemory, value: &Value, alignment: usize) -> MatchColumns {
+    let base_address = mapped.remote_region.base_address;
+    let data = mapped.data();
+    let value_type = value.value_type();
+    let size = value_type.size();
+    let needle = value.to_bytes();
+    let mut matches = MatchColumns::default();
+
+    if alignment == size && !value_type.is_float() {
+        matches.addresses = simd::find_equal(data, &needle)
+            .into_iter()
+            .map(|index| base_address + index * size)
+            .collect();
+        matches.values = needle.repeat(matches.addresses.len());
+        return matches;
+    }
+
+    let mut offset = 0;
+    while offset + size <= data.len() {
+        if let Some(current) = Value::from_bytes(data, offset, value_type) {
+            if values_equal(&current, value) {
+                matches.addresses.push(base_address + offset);
+                matches
+                    .values
+                    .extend_from_slice(&data[offset..offset + size]);
+            }
+        }
+        offset += alignment;
+    }
+    matches
+}
+
 /// Check if two values are within a percentage margin of each other
 fn values_within_margin(a: &Value, b: &Value, margin_percent: f64) -> bool {
     use crate::values::value_to_f64;
@@ -455,6 +762,25 @@ mod tests {
         assert_ne!(FilterOp::Equals, FilterOp::LessThan);
     }
 
+    #[test]
+    fn test_match_columns_advance() {
+        let mut columns = MatchColumns {
+            addresses: vec![0x1000, 0x1004, 0x1008],
+            values: [1i32, 2, 3].iter().flat_map(|v| v.to_le_bytes()).collect(),
+            previous: Vec::new(),
+        };
+        assert!(columns.get(0, ValueType::I32).previous_value.is_none());
+
+        let fresh = [20i32, 30].iter().flat_map(|v| v.to_le_bytes()).collect();
+        columns.advance(&[1, 2], fresh, 4);
+
+        assert_eq!(columns.len(), 2);
+        let last = columns.get(1, ValueType::I32);
+        assert_eq!(last.address, 0x1008);
+        assert!(matches!(last.current_value, Value::I32(30)));
+        assert!(matches!(last.previous_value, Some(Value::I32(3))));
+    }
+
     #[test]
     fn test_values_within_margin() {
         // Test exact match
@@ -502,4 +828,179 @@ mod tests {
             0.0
         ));
     }
+
+    /// End-to-end scans of a buffer in the test's own process
+    #[cfg(unix)]
+    mod own_process {
+        use super::*;
+
+        /// Region covering `buffer` in the test's own process
+        fn buffer_region(buffer: &[u32]) -> MemoryRegion {
+            use crate::process::{MemoryProtection, MemoryState, MemoryType};
+
+            MemoryRegion {
+                base_address: buffer.as_ptr() as usize,
+                size: std::mem::size_of_val(buffer),
+                protect: MemoryProtection {
+                    no_access: false,
+                    read: true,
+                    write: true,
+                    execute: false,
+                    copy_on_write: false,
+                    guarded: false,
+                    no_cache: false,
+                },
+                state: MemoryState {
+                    committed: true,
+                    free: false,
+                    reserved: false,
+                },
+                type_: MemoryType::Private,
+                image_file: None,
+            }
+        }
+
+        /// Store `value` so the write is not optimized away before the scanner reads it
+        fn set(buffer: &mut [u32], index: usize, value: u32) {
+            unsafe { std::ptr::write_volatile(&mut buffer[index], value) };
+        }
+
+        /// (buffer index, current value, previous value) of every match
+        fn snapshot(
+            scanner: &InteractiveScanner,
+            buffer: &[u32],
+        ) -> Vec<(usize, u32, Option<u32>)> {
+            let as_u32 = |value: &Value| match value {
+                Value::U32(v) => *v,
+                other => panic!("unexpected value {:?}", other),
+            };
+            let base = buffer.as_ptr() as usize;
+            scanner
+                .matches()
+                .map(|m| {
+                    (
+                        (m.address - base) / 4,
+                        as_u32(&m.current_value),
+                        m.previous_value.as_ref().map(as_u32),
+                    )
+                })
+                .collect()
+        }
+
+        #[test]
+        fn test_initial_scan() {
+            let buffer = vec![10u32, 20, 10, 30, 10];
+            let process = crate::process::open_process(std::process::id()).unwrap();
+            let mut scanner =
+                InteractiveScanner::new(&process, vec![buffer_region(&buffer)], ValueType::U32);
+
+            assert_eq!(scanner.initial_scan().unwrap(), 5);
+            assert_eq!(snapshot(&scanner, &buffer)[3], (3, 30, None));
+
+            assert_eq!(scanner.initial_scan_eq(Value::U32(10)).unwrap(), 3);
+            assert_eq!(
+                snapshot(&scanner, &buffer),
+                vec![(0, 10, None), (2, 10, None), (4, 10, None)]
+            );
+        }
+
+        #[test]
+        fn test_filter() {
+            let mut buffer = vec![10u32, 10, 10, 10, 99];
+            let process = crate::process::open_process(std::process::id()).unwrap();
+            let mut scanner =
+                InteractiveScanner::new(&process, vec![buffer_region(&buffer)], ValueType::U32);
+            scanner.initial_scan_eq(Value::U32(10)).unwrap();
+
+            // Changed/Unchanged take the packed path
+            set(&mut buffer, 0, 11);
+            set(&mut buffer, 1, 9);
+            set(&mut buffer, 2, 12);
+            assert_eq!(scanner.filter(FilterOp::Changed, None).unwrap(), 3);
+            assert_eq!(
+                snapshot(&scanner, &buffer),
+                vec![(0, 11, Some(10)), (1, 9, Some(10)), (2, 12, Some(10))]
+            );
+
+            set(&mut buffer, 2, 13);
+            assert_eq!(scanner.filter(FilterOp::Unchanged, None).unwrap(), 2);
+            assert_eq!(
+                snapshot(&scanner, &buffer),
+                vec![(0, 11, Some(11)), (1, 9, Some(9))]
+            );
+
+            set(&mut buffer, 0, 15);
+            set(&mut buffer, 1, 5);
+            assert_eq!(scanner.filter(FilterOp::Increased, None).unwrap(), 1);
+            assert_eq!(snapshot(&scanner, &buffer), vec![(0, 15, Some(11))]);
+
+            set(&mut buffer, 0, 14);
+            assert_eq!(scanner.filter(FilterOp::Decreased, None).unwrap(), 1);
+            assert_eq!(
+                scanner
+                    .filter(FilterOp::Equals, Some(Value::U32(14)))
+                    .unwrap(),
+                1
+            );
+            assert_eq!(snapshot(&scanner, &buffer), vec![(0, 14, Some(14))]);
+        }
+
+        #[test]
+        fn test_retain_indices() {
+            let mut buffer = vec![1u32, 2, 3, 4];
+            let process = crate::process::open_process(std::process::id()).unwrap();
+            let mut scanner =
+                InteractiveScanner::new(&process, vec![buffer_region(&buffer)], ValueType::U32);
+            scanner.initial_scan().unwrap();
+
+            set(&mut buffer, 1, 20);
+            set(&mut buffer, 3, 40);
+            let current: Vec<u8> = [1u32, 20, 3, 40]
+                .iter()
+                .flat_map(|v| v.to_le_bytes())
+                .collect();
+            assert_eq!(scanner.current_values_packed(), current);
+
+            assert_eq!(scanner.retain_indices(&[1, 3]).unwrap(), 2);
+            assert_eq!(
+                snapshot(&scanner, &buffer),
+                vec![(1, 20, Some(2)), (3, 40, Some(4))]
+            );
+            assert!(scanner.retain_indices(&[1, 0]).is_err());
+            assert!(scanner.retain_indices(&[2]).is_err());
+        }
+
+        #[test]
+        fn test_filter_checkpoint_relative() {
+            let mut buffer = vec![0u32; 3];
+            let process = crate::process::open_process(std::process::id()).unwrap();
+            let mut scanner =
+                InteractiveScanner::new(&process, vec![buffer_region(&buffer)], ValueType::U32);
+            scanner.initial_scan().unwrap();
+            scanner.save_checkpoint("cp1".to_string()).unwrap();
+
+            for (index, value) in [10, 10, 5].into_iter().enumerate() {
+                set(&mut buffer, index, value);
+            }
+            scanner.save_checkpoint("cp2".to_string()).unwrap();
+
+            // Steady +10 steps survive, the +5 then +15 step does not
+            for (index, value) in [20, 21, 20].into_iter().enumerate() {
+                set(&mut buffer, index, value);
+            }
+            scanner.save_checkpoint("cp3".to_string()).unwrap();
+
+            set(&mut buffer, 0, 25);
+            assert_eq!(
+                scanner
+                    .filter_checkpoint_relative("cp1", "cp2", "cp3", 10.0)
+                    .unwrap(),
+                2
+            );
+            assert_eq!(
+                snapshot(&scanner, &buffer),
+                vec![(0, 25, Some(0)), (1, 21, Some(0))]
+            );
+        }
+    }
 }
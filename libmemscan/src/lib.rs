@@ -13,26 +13,126 @@ pub mod interactive;
 pub mod memmap;
 pub mod process;
 pub mod scanner;
+pub mod simd;
 pub mod values;
 
 use anyhow::Result;
 
+/// Marks bytes in [`HEX_LUT`] that are not hex digits
+const HEX_INVALID: u8 = 0xFF;
+/// Marks ASCII whitespace in [`HEX_LUT`]
+const HEX_SPACE: u8 = 0xFE;
+
+/// Maps every byte to its hex nibble value, [`HEX_SPACE`] or [`HEX_INVALID`]
+static HEX_LUT: [u8; 256] = build_hex_lut();
+
+const fn build_hex_lut() -> [u8; 256] {
+    let mut lut = [HEX_INVALID; 256];
+    let mut i = 0;
+    while i < 10 {
+        lut[b'0' as usize + i] = i as u8;
+        i += 1;
+    }
+    let mut i = 0;
+    while i < 6 {
+        lut[b'a' as usize + i] = 10 + i as u8;
+        lut[b'A' as usize + i] = 10 + i as u8;
+        i += 1;
+    }
+    // Same set as `char::is_whitespace` restricted to ASCII
+    let spaces = [b' ', b'\t', b'\n', 0x0B, 0x0C, b'\r'];
+    let mut i = 0;
+    while i < spaces.len() {
+        lut[spaces[i] as usize] = HEX_SPACE;
+        i += 1;
+    }
+    lut
+}
+
 /// Parse a hex string like "DEADBEEF" or "4D 5A 90 00" into bytes.
 pub fn parse_hex_pattern(s: &str) -> Result<Vec<u8>> {
-    let filtered: String = s.chars().filter(|c| !c.is_whitespace()).collect();
+    Ok(decode_hex_digits(&hex_digits(s, false)?))
+}
+
+/// Parse a hex pattern that may contain `??` wildcard bytes, like "4D ?? 90 ??".
+///
+/// Returns the pattern bytes and a mask of the same length holding `0xFF` for
+/// literal bytes and `0x00` for wildcards (whose pattern byte is `0x00`).
+pub fn parse_hex_pattern_masked(s: &str) -> Result<(Vec<u8>, Vec<u8>)> {
+    let digits = hex_digits(s, true)?;
+    if !digits.contains(&b'?') {
+        let bytes = decode_hex_digits(&digits);
+        let mask = vec![0xFF; bytes.len()];
+        return Ok((bytes, mask));
+    }
+
+    let mut bytes = Vec::with_capacity(digits.len() / 2);
+    let mut mask = Vec::with_capacity(digits.len() / 2);
+    for pair in digits.chunks_exact(2) {
+        if pair == b"??" {
+            bytes.push(0x00);
+            mask.push(0x00);
+        } else if pair.contains(&b'?') {
+            anyhow::bail!(
+                "wildcard '{}' must cover a whole byte",
+                String::from_utf8_lossy(pair)
+            );
+        } else {
+            bytes.push(decode_hex_pair(pair));
+            mask.push(0xFF);
+        }
+    }
+    Ok((bytes, mask))
+}
+
+/// Strip whitespace from a hex pattern and check that only whole bytes of hex
+/// digits (and `?` when `wildcards` is set) remain.
+///
+/// Validation happens in the same [`HEX_LUT`] pass that strips the whitespace,
+/// so the returned digits can be decoded without further checks.
+fn hex_digits(s: &str, wildcards: bool) -> Result<Vec<u8>> {
+    let stripped;
+    let text = if s.is_ascii() {
+        s
+    } else {
+        stripped = s.chars().filter(|c| !c.is_whitespace()).collect::<String>();
+        &stripped
+    };
 
-    if filtered.len() % 2 != 0 {
+    let mut digits = Vec::with_capacity(text.len());
+    for (i, &b) in text.as_bytes().iter().enumerate() {
+        match HEX_LUT[b as usize] {
+            HEX_SPACE => {}
+            HEX_INVALID if !(wildcards && b == b'?') => {
+                // Every byte before `i` is ASCII, so `i` is a char boundary
+                let c = text[i..].chars().next().unwrap_or_default();
+                anyhow::bail!("invalid hex digit '{}'", c);
+            }
+            _ => digits.push(b),
+        }
+    }
+
+    if digits.len() & 1 != 0 {
         anyhow::bail!("hex pattern length must be even");
     }
+    Ok(digits)
+}
 
-    let mut bytes = Vec::with_capacity(filtered.len() / 2);
-    for i in (0..filtered.len()).step_by(2) {
-        let byte_str = &filtered[i..i + 2];
-        let b = u8::from_str_radix(byte_str, 16)
-            .map_err(|_| anyhow::anyhow!("invalid hex byte '{}'", byte_str))?;
-        bytes.push(b);
+/// Decode an even number of validated hex digits into bytes
+fn decode_hex_digits(digits: &[u8]) -> Vec<u8> {
+    // Decode whole 16-digit blocks with SIMD where available, then the rest
+    // one pair at a time.
+    let mut bytes = Vec::with_capacity(digits.len() / 2);
+    let decoded = simd::decode_hex_prefix(digits, &mut bytes);
+    for pair in digits[decoded..].chunks_exact(2) {
+        bytes.push(decode_hex_pair(pair));
     }
-    Ok(bytes)
+    bytes
+}
+
+/// Decode two validated hex digits into a byte
+fn decode_hex_pair(pair: &[u8]) -> u8 {
+    HEX_LUT[pair[0] as usize] << 4 | HEX_LUT[pair[1] as usize]
 }
 
 #[cfg(test)]
@@ -80,4 +180,55 @@ mod tests {
         let result = parse_hex_pattern("4D 5A 90 00").unwrap();
         assert_eq!(result, vec![0x4D, 0x5A, 0x90, 0x00]);
     }
+
+    #[test]
+    fn test_parse_hex_long() {
+        let result = parse_hex_pattern(&"DEADbeef".repeat(9)).unwrap();
+        assert_eq!(result, [0xDE, 0xAD, 0xBE, 0xEF].repeat(9));
+    }
+
+    #[test]
+    fn test_parse_hex_long_invalid_char() {
+        // Invalid digit inside the first 16-digit block and in the tail
+        assert!(parse_hex_pattern(&format!("0123456G{}", "00".repeat(16))).is_err());
+        assert!(parse_hex_pattern(&format!("{}0G", "00".repeat(16))).is_err());
+    }
+
+    #[test]
+    fn test_parse_hex_unicode_whitespace() {
+        let result = parse_hex_pattern("DE\u{00A0}AD").unwrap();
+        assert_eq!(result, vec![0xDE, 0xAD]);
+    }
+
+    #[test]
+    fn test_parse_hex_invalid_unicode_char() {
+        let err = parse_hex_pattern("DE\u{00C9}D").unwrap_err();
+        assert!(err.to_string().contains('\u{00C9}'));
+    }
+
+    #[test]
+    fn test_parse_hex_rejects_wildcards() {
+        assert!(parse_hex_pattern("4D ?? 90").is_err());
+    }
+
+    #[test]
+    fn test_parse_hex_masked_wildcards() {
+        let (bytes, mask) = parse_hex_pattern_masked("4D ?? 90 ??").unwrap();
+        assert_eq!(bytes, vec![0x4D, 0x00, 0x90, 0x00]);
+        assert_eq!(mask, vec![0xFF, 0x00, 0xFF, 0x00]);
+    }
+
+    #[test]
+    fn test_parse_hex_masked_without_wildcards() {
+        let (bytes, mask) = parse_hex_pattern_masked("DEADBEEF").unwrap();
+        assert_eq!(bytes, vec![0xDE, 0xAD, 0xBE, 0xEF]);
+        assert_eq!(mask, vec![0xFF; 4]);
+    }
+
+    #[test]
+    fn test_parse_hex_masked_half_wildcard() {
+        assert!(parse_hex_pattern_masked("4?").is_err());
+        assert!(parse_hex_pattern_masked("4D?").is_err());
+        assert!(parse_hex_pattern_masked("?G").is_err());
+    }
 }
@@ -55,13 +55,37 @@ impl MappedMemoryUnix {
         })
     }
 
+    /// Create memory mappings for several regions, reading them with as few
+    /// `process_vm_readv` calls as possible.
+    ///
+    /// Returns one entry per region, `None` where the region could not be read completely.
+    pub fn map_regions(proc: &ProcessHandle, regions: &[MemoryRegion]) -> Vec<Option<Self>> {
+        let addrs: Vec<usize> = regions.iter().map(|region| region.base_address).collect();
+        let mut buffers: Vec<Vec<u8>> = regions
+            .iter()
+            .map(|region| vec![0u8; region.size])
+            .collect();
+        let complete = proc.read_mem_batch(&addrs, &mut buffers);
+
+        buffers
+            .into_iter()
+            .zip(addrs)
+            .zip(complete)
+            .map(|((buffer, remote_addr), ok)| {
+                ok.then_some(Self {
+                    buffer,
+                    remote_addr,
+                })
+            })
+            .collect()
+    }
+
     /// Get a slice view of mapped memory
     pub fn as_slice(&self) -> &[u8] {
         &self.buffer
     }
 
     /// Refresh mapped memory by re-reading from the remote process
-    #[allow(dead_code)]
     pub fn refresh(&mut self, proc: &ProcessHandle) -> Result<()> {
         let bytes_read = proc
             .read_mem(self.remote_addr, &mut self.buffer)
@@ -1,19 +1,20 @@
 #![cfg(unix)]
 use crate::process::{
-    MemoryProtection, MemoryRegion, MemoryState, MemoryType, ProcessHandle, SystemInfo,
-    is_region_interesting,
+    MemoryProtection, MemoryRegion, MemoryState, MemoryType, ProcessHandle, SystemInfo, WriteRun,
+    coalesce_write_runs, is_region_interesting,
 };
 use anyhow::Result;
 use libc::{_SC_PAGESIZE, pid_t, sysconf};
 use std::{
     collections::HashMap,
-    fs::{File, read_link},
+    fs::{File, OpenOptions, read_link},
     io::{BufRead, BufReader},
     os::{
         fd::{AsRawFd, RawFd},
         unix::fs::FileExt,
     },
     path::Path,
+    sync::atomic::{AtomicBool, Ordering},
 };
 
 // ================== Linux/UNIX-specific process types ==================
@@ -25,8 +26,15 @@ pub struct ProcessHandleUnix {
     maps: Vec<MemoryRegion>,
     page_size: usize,
     exe_path: Option<String>,
+    /// Cleared once `process_vm_readv` turns out to be unusable for this process
+    vm_readv: AtomicBool,
+    /// Cleared once `process_vm_writev` turns out to be unusable for this process
+    vm_writev: AtomicBool,
 }
 
+/// Maximum number of iovecs accepted by a single `process_vm_readv`/`process_vm_writev` call
+const IOV_MAX: usize = 1024;
+
 unsafe impl Send for ProcessHandleUnix {}
 unsafe impl Sync for ProcessHandleUnix {}
 
@@ -39,13 +47,217 @@ impl ProcessHandleUnix {
         self.mem.as_raw_fd()
     }
 
+    /// Read remote memory at `addr` into `buf`, returning the number of bytes read.
+    ///
+    /// Uses `process_vm_readv(2)`, which copies the whole range in a single
+    /// syscall. Whatever it could not read (the whole range when it fails) is
+    /// read with `pread` on `/proc/<pid>/mem`, which can also read pages the
+    /// syscall cannot.
     pub fn read_mem(&self, addr: usize, buf: &mut [u8]) -> std::io::Result<usize> {
-        self.mem.read_at(buf, addr as u64)
+        let mut read = 0;
+        #[cfg(target_os = "linux")]
+        match self.read_mem_vm(addr, buf) {
+            Ok(n) if n == buf.len() => return Ok(n),
+            Ok(n) => read = n,
+            Err(_) => {}
+        }
+
+        match self.mem.read_at(&mut buf[read..], (addr + read) as u64) {
+            Ok(n) => Ok(read + n),
+            Err(_) if read > 0 => Ok(read),
+            Err(e) => Err(e),
+        }
+    }
+
+    /// Read remote memory with a single `process_vm_readv` call
+    #[cfg(target_os = "linux")]
+    fn read_mem_vm(&self, addr: usize, buf: &mut [u8]) -> std::io::Result<usize> {
+        let local = [iovec(buf.as_mut_ptr() as usize, buf.len())];
+        let remote = [iovec(addr, buf.len())];
+        self.transfer_vm(libc::process_vm_readv, &self.vm_readv, &local, &remote)
+    }
+
+    /// Read several remote ranges, `bufs[i]` from `addrs[i]`, returning which
+    /// of them were read completely.
+    ///
+    /// Up to [`IOV_MAX`] ranges are read per `process_vm_readv` call. A range the
+    /// syscall cannot read completely is retried on its own with [`Self::read_mem`].
+    pub fn read_mem_batch(&self, addrs: &[usize], bufs: &mut [Vec<u8>]) -> Vec<bool> {
+        let mut complete = vec![false; bufs.len()];
+        let mut start = 0;
+        while start < bufs.len() {
+            let end = bufs.len().min(start + IOV_MAX);
+            #[cfg(target_os = "linux")]
+            let read = self.read_ranges_vm(&addrs[start..end], &mut bufs[start..end]);
+            #[cfg(not(target_os = "linux"))]
+            let read = 0;
+
+            complete[start..start + read].fill(true);
+            start += read;
+
+            if start < end {
+                let buf = &mut bufs[start];
+                complete[start] = self
+                    .read_mem(addrs[start], buf)
+                    .is_ok_and(|n| n == buf.len());
+                start += 1;
+            }
+        }
+        complete
+    }
+
+    /// Read `bufs` with a single `process_vm_readv` call, returning the number
+    /// of leading buffers that were filled completely.
+    #[cfg(target_os = "linux")]
+    fn read_ranges_vm(&self, addrs: &[usize], bufs: &mut [Vec<u8>]) -> usize {
+        let local: Vec<libc::iovec> = bufs
+            .iter_mut()
+            .map(|buf| iovec(buf.as_mut_ptr() as usize, buf.len()))
+            .collect();
+        let remote: Vec<libc::iovec> = addrs
+            .iter()
+            .zip(bufs.iter())
+            .map(|(&addr, buf)| iovec(addr, buf.len()))
+            .collect();
+
+        self.transfer_vm(libc::process_vm_readv, &self.vm_readv, &local, &remote)
+            .map_or(0, |n| complete_iovecs(&remote, n))
     }
 
     pub fn write_mem(&self, addr: usize, buf: &[u8]) -> std::io::Result<usize> {
         self.mem.write_at(buf, addr as u64)
     }
+
+    /// Write `buf` to every address in `addresses`, returning how many were written.
+    ///
+    /// Adjacent addresses are merged into runs, and up to [`IOV_MAX`] runs are
+    /// written per `process_vm_writev` call. Every local iovec points into the
+    /// same buffer holding `buf` repeated for the longest run. A run the
+    /// syscall cannot write (e.g. a read-only page) is retried with `pwrite` on
+    /// `/proc/<pid>/mem`, which may write it.
+    pub fn write_mem_batch(&self, addresses: &[usize], buf: &[u8]) -> usize {
+        let width = buf.len();
+        if width == 0 {
+            return 0;
+        }
+
+        let runs = coalesce_write_runs(addresses, width);
+        let fill = buf.repeat(runs.iter().map(|run| run.count).max().unwrap_or(0));
+
+        let mut written = 0;
+        for batch in runs.chunks(IOV_MAX) {
+            let mut pending = batch;
+            while !pending.is_empty() {
+                #[cfg(target_os = "linux")]
+                let complete = self.write_runs_vm(pending, &fill, width);
+                #[cfg(not(target_os = "linux"))]
+                let complete = 0;
+
+                written += pending[..complete]
+                    .iter()
+                    .map(|run| run.count)
+                    .sum::<usize>();
+                pending = &pending[complete..];
+
+                if let Some((run, rest)) = pending.split_first() {
+                    let bytes = &fill[..run.count * width];
+                    written += self.mem.write_at(bytes, run.addr as u64).unwrap_or(0) / width;
+                    pending = rest;
+                }
+            }
+        }
+        written
+    }
+
+    /// Write `runs` with a single `process_vm_writev` call, returning the number
+    /// of leading runs that were written completely.
+    #[cfg(target_os = "linux")]
+    fn write_runs_vm(&self, runs: &[WriteRun], fill: &[u8], width: usize) -> usize {
+        let local: Vec<libc::iovec> = runs
+            .iter()
+            .map(|run| iovec(fill.as_ptr() as usize, run.count * width))
+            .collect();
+        let remote: Vec<libc::iovec> = runs
+            .iter()
+            .map(|run| iovec(run.addr, run.count * width))
+            .collect();
+
+        self.transfer_vm(libc::process_vm_writev, &self.vm_writev, &local, &remote)
+            .map_or(0, |n| complete_iovecs(&remote, n))
+    }
+
+    /// Make one `process_vm_readv`/`process_vm_writev` call, returning the
+    /// number of bytes transferred.
+    ///
+    /// `enabled` is cleared once the syscall turns out to be unsupported by the
+    /// kernel or forbidden for this process, so later calls fail fast instead of
+    /// paying for the failing syscall every time.
+    #[cfg(target_os = "linux")]
+    fn transfer_vm(
+        &self,
+        syscall: VmSyscall,
+        enabled: &AtomicBool,
+        local: &[libc::iovec],
+        remote: &[libc::iovec],
+    ) -> std::io::Result<usize> {
+        if !enabled.load(Ordering::Relaxed) {
+            return Err(std::io::ErrorKind::Unsupported.into());
+        }
+
+        let n = unsafe {
+            syscall(
+                self.pid,
+                local.as_ptr(),
+                local.len() as libc::c_ulong,
+                remote.as_ptr(),
+                remote.len() as libc::c_ulong,
+                0,
+            )
+        };
+        if n < 0 {
+            let e = std::io::Error::last_os_error();
+            if matches!(e.raw_os_error(), Some(libc::ENOSYS) | Some(libc::EPERM)) {
+                enabled.store(false, Ordering::Relaxed);
+            }
+            return Err(e);
+        }
+        Ok(n as usize)
+    }
+}
+
+/// Signature shared by `process_vm_readv` and `process_vm_writev`
+#[cfg(target_os = "linux")]
+type VmSyscall = unsafe extern "C" fn(
+    pid_t,
+    *const libc::iovec,
+    libc::c_ulong,
+    *const libc::iovec,
+    libc::c_ulong,
+    libc::c_ulong,
+) -> libc::ssize_t;
+
+#[cfg(target_os = "linux")]
+fn iovec(addr: usize, len: usize) -> libc::iovec {
+    libc::iovec {
+        iov_base: addr as *mut libc::c_void,
+        iov_len: len,
+    }
+}
+
+/// Number of leading `remote` iovecs covered by `transferred` bytes; the kernel
+/// stops at the first remote iovec it cannot transfer completely
+#[cfg(target_os = "linux")]
+fn complete_iovecs(remote: &[libc::iovec], transferred: usize) -> usize {
+    let mut remaining = transferred;
+    let mut complete = 0;
+    for iov in remote {
+        if remaining < iov.iov_len {
+            break;
+        }
+        remaining -= iov.iov_len;
+        complete += 1;
+    }
+    complete
 }
 
 // ================== Linux/UNIX-specific helpers ==================
@@ -159,10 +371,14 @@ fn perms_to_type(perms: &str, pathname: &Option<String>, _exe_path: &Option<Stri
 
 pub(crate) fn open_process(pid: u32) -> Result<ProcessHandle> {
     let pid_i = pid as pid_t;
-    // Open /proc/<pid>/mem for reading
+    // Open /proc/<pid>/mem for reading, and for writing where permitted
     let mem_path = format!("/proc/{pid}/mem");
-    let mem =
-        File::open(&mem_path).map_err(|e| anyhow::anyhow!("failed to open {}: {}", mem_path, e))?;
+    let mem = OpenOptions::new()
+        .read(true)
+        .write(true)
+        .open(&mem_path)
+        .or_else(|_| File::open(&mem_path))
+        .map_err(|e| anyhow::anyhow!("failed to open {}: {}", mem_path, e))?;
 
     let (maps, exe_path) = parse_proc_maps(pid_i)?;
     let page_size = unsafe { sysconf(_SC_PAGESIZE) as usize };
@@ -173,6 +389,8 @@ pub(crate) fn open_process(pid: u32) -> Result<ProcessHandle> {
         maps,
         page_size,
         exe_path,
+        vm_readv: AtomicBool::new(true),
+        vm_writev: AtomicBool::new(true),
     })
 }
 
@@ -328,3 +546,86 @@ pub(crate) fn read_process_memory(proc: &ProcessHandleUnix, addr: usize, buf: &m
 pub(crate) fn write_process_memory(proc: &ProcessHandleUnix, addr: usize, buf: &[u8]) -> usize {
     proc.write_mem(addr, buf).unwrap_or(0)
 }
+
+pub(crate) fn write_process_memory_batch(
+    proc: &ProcessHandleUnix,
+    addresses: &[usize],
+    buf: &[u8],
+) -> usize {
+    proc.write_mem_batch(addresses, buf)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Map `pages` read/write anonymous pages filled with `i as u8` at byte `i`
+    fn map_test_pages(pages: usize) -> (*mut u8, usize) {
+        let len = pages * unsafe { sysconf(_SC_PAGESIZE) as usize };
+        let ptr = unsafe {
+            libc::mmap(
+                std::ptr::null_mut(),
+                len,
+                libc::PROT_READ | libc::PROT_WRITE,
+                libc::MAP_PRIVATE | libc::MAP_ANONYMOUS,
+                -1,
+                0,
+            )
+        };
+        assert_ne!(ptr, libc::MAP_FAILED);
+        let ptr = ptr as *mut u8;
+        for i in 0..len {
+            unsafe { ptr.add(i).write_volatile(i as u8) };
+        }
+        (ptr, len)
+    }
+
+    #[test]
+    fn test_read_mem_reads_past_unreadable_page() {
+        let (ptr, len) = map_test_pages(2);
+        let page = len / 2;
+        // `process_vm_readv` stops at the PROT_NONE page, `pread` reads it anyway
+        let protected = unsafe { libc::mprotect(ptr.add(page).cast(), page, libc::PROT_NONE) };
+        assert_eq!(protected, 0);
+
+        let proc = open_process(std::process::id()).unwrap();
+        let mut buf = vec![0u8; len];
+        let read = proc.read_mem(ptr as usize, &mut buf).unwrap();
+        unsafe { libc::munmap(ptr.cast(), len) };
+
+        assert_eq!(read, len);
+        assert!(buf.iter().enumerate().all(|(i, &b)| b == i as u8));
+    }
+
+    #[test]
+    fn test_write_mem_batch() {
+        let (ptr, len) = map_test_pages(3);
+        let page = len / 3;
+        // The read-only middle page makes `process_vm_writev` stop early, so
+        // its run goes through `pwrite` and the last run is resubmitted
+        let protected = unsafe { libc::mprotect(ptr.add(page).cast(), page, libc::PROT_READ) };
+        assert_eq!(protected, 0);
+
+        let base = ptr as usize;
+        let offsets = [8, 0, 4, 100, page, page + 4, 2 * page + 12];
+        let addresses: Vec<usize> = offsets.iter().map(|&offset| base + offset).collect();
+        let value = 0xA1B2C3D4u32.to_le_bytes();
+
+        let proc = open_process(std::process::id()).unwrap();
+        let written = proc.write_mem_batch(&addresses, &value);
+        let mut memory = vec![0u8; len];
+        for (i, byte) in memory.iter_mut().enumerate() {
+            *byte = unsafe { ptr.add(i).read_volatile() };
+        }
+        unsafe { libc::munmap(ptr.cast(), len) };
+
+        assert_eq!(written, offsets.len());
+        for (i, &byte) in memory.iter().enumerate() {
+            let slot = offsets
+                .iter()
+                .find(|&&offset| (offset..offset + 4).contains(&i));
+            let expected = slot.map_or(i as u8, |&offset| value[i - offset]);
+            assert_eq!(byte, expected, "byte {}", i);
+        }
+    }
+}
@@ -8,12 +8,18 @@ use std::collections::HashMap;
 
 use crate::process::{MemoryRegion, ProcessHandle};
 use anyhow::Result;
+use rayon::prelude::*;
 
 #[cfg(unix)]
 use crate::linux;
 #[cfg(windows)]
 use crate::windows;
 
+/// Regions up to this size are read together with other small regions
+const BATCH_REGION_MAX_SIZE: usize = 128 * 1024;
+/// Maximum number of small regions read together
+const BATCH_MAX_REGIONS: usize = 64;
+
 /// Represents a mapped memory view of remote process memory
 #[derive(Debug)]
 pub struct MappedMemory {
@@ -46,6 +52,33 @@ impl MappedMemory {
         })
     }
 
+    /// Map several regions of remote process memory, skipping those that fail to map
+    ///
+    /// On Linux the regions are read with one `process_vm_readv` call per
+    /// `IOV_MAX` regions. A region such a call cannot read completely is
+    /// retried on its own, falling back to `pread` on `/proc/<pid>/mem`.
+    pub fn map_regions(proc: &ProcessHandle, regions: Vec<MemoryRegion>) -> Vec<Self> {
+        #[cfg(windows)]
+        return regions
+            .into_iter()
+            .filter_map(|region| Self::map_region(proc, region).ok())
+            .collect();
+        #[cfg(unix)]
+        {
+            let inner = linux::memmap::MappedMemoryUnix::map_regions(proc, &regions);
+            return regions
+                .into_iter()
+                .zip(inner)
+                .filter_map(|(region, inner)| {
+                    Some(Self {
+                        remote_region: region,
+                        inner: inner?,
+                    })
+                })
+                .collect();
+        }
+    }
+
     /// Get a slice to the mapped memory
     ///
     /// # Safety
@@ -54,6 +87,18 @@ impl MappedMemory {
     pub fn data(&self) -> &[u8] {
         return self.inner.as_slice();
     }
+
+    /// Bring [`MappedMemory::data`] up to date with the remote process
+    ///
+    /// On Linux the data is a local copy and is read again. Windows views
+    /// already reflect the remote memory.
+    pub fn refresh(&mut self, proc: &ProcessHandle) -> Result<()> {
+        #[cfg(windows)]
+        let _ = proc;
+        #[cfg(unix)]
+        self.inner.refresh(proc)?;
+        Ok(())
+    }
 }
 
 /// Manager for tracking multiple mapped memory regions
@@ -82,6 +127,48 @@ impl<'a> MemoryMapper<'a> {
         Ok(self.get(remote_base_address).unwrap())
     }
 
+    /// Map several memory regions, reading them from the process in parallel.
+    ///
+    /// Small regions are grouped into batches that are each read with a single
+    /// syscall, so many small regions don't cost one syscall each. Regions that
+    /// fail to map are skipped.
+    ///
+    /// ## Returns
+    /// The number of regions that were mapped.
+    pub fn map_regions(&mut self, regions: Vec<MemoryRegion>) -> usize {
+        let process = self.process;
+        let mapped: Vec<MappedMemory> = batch_regions(regions)
+            .into_par_iter()
+            .flat_map_iter(|batch| MappedMemory::map_regions(process, batch))
+            .collect();
+
+        let count = mapped.len();
+        for mapped in mapped {
+            self.mappings
+                .insert(mapped.remote_region.base_address, mapped);
+        }
+        count
+    }
+
+    /// Refresh all mapped regions in parallel, dropping those that can no
+    /// longer be read.
+    ///
+    /// ## Returns
+    /// The number of regions that are still mapped.
+    pub fn refresh(&mut self) -> usize {
+        let process = self.process;
+        let unreadable: Vec<usize> = self
+            .mappings
+            .par_iter_mut()
+            .filter_map(|(&base, mapped)| mapped.refresh(process).is_err().then_some(base))
+            .collect();
+
+        for base in unreadable {
+            self.mappings.remove(&base);
+        }
+        self.mappings.len()
+    }
+
     /// Get a mapped region by index
     pub fn get(&self, remote_base_address: usize) -> Option<&MappedMemory> {
         self.mappings.get(&remote_base_address)
@@ -127,6 +214,28 @@ impl<'a> MemoryMapper<'a> {
     }
 }
 
+/// Group regions for [`MappedMemory::map_regions`]: regions up to
+/// [`BATCH_REGION_MAX_SIZE`] bytes are grouped [`BATCH_MAX_REGIONS`] at a time,
+/// larger regions are mapped on their own.
+fn batch_regions(regions: Vec<MemoryRegion>) -> Vec<Vec<MemoryRegion>> {
+    let mut batches = Vec::new();
+    let mut small = Vec::new();
+    for region in regions {
+        if region.size > BATCH_REGION_MAX_SIZE {
+            batches.push(vec![region]);
+            continue;
+        }
+        small.push(region);
+        if small.len() == BATCH_MAX_REGIONS {
+            batches.push(std::mem::take(&mut small));
+        }
+    }
+    if !small.is_empty() {
+        batches.push(small);
+    }
+    batches
+}
+
 impl IntoIterator for MemoryMapper<'_> {
     type Item = MappedMemory;
     type IntoIter = std::vec::IntoIter<MappedMemory>;
@@ -138,10 +247,46 @@ impl IntoIterator for MemoryMapper<'_> {
 
 #[cfg(test)]
 mod tests {
+    use super::*;
+    use crate::process::{MemoryProtection, MemoryState, MemoryType};
+
+    fn region(base_address: usize, size: usize) -> MemoryRegion {
+        MemoryRegion {
+            base_address,
+            size,
+            protect: MemoryProtection {
+                no_access: false,
+                read: true,
+                write: true,
+                execute: false,
+                copy_on_write: false,
+                guarded: false,
+                no_cache: false,
+            },
+            state: MemoryState {
+                committed: true,
+                free: false,
+                reserved: false,
+            },
+            type_: MemoryType::Private,
+            image_file: None,
+        }
+    }
 
     #[test]
     fn test_memory_mapper_new() {
         // We can't create a valid ProcessHandle in tests, so we skip this test
         // In actual usage, ProcessHandle will be created via open_process()
     }
+
+    #[test]
+    fn test_batch_regions() {
+        let mut regions: Vec<MemoryRegion> = (0..BATCH_MAX_REGIONS + 1)
+            .map(|i| region(i * 0x1000, 0x1000))
+            .collect();
+        regions.insert(1, region(0x1000_0000, BATCH_REGION_MAX_SIZE + 1));
+
+        let sizes: Vec<usize> = batch_regions(regions).iter().map(Vec::len).collect();
+        assert_eq!(sizes, vec![1, BATCH_MAX_REGIONS, 1]);
+    }
 }
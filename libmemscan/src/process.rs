@@ -70,6 +70,50 @@ pub fn write_process_memory(proc: &ProcessHandle, addr: usize, buf: &[u8]) -> us
     return linux::process::write_process_memory(proc, addr, buf);
 }
 
+/// Write the same bytes to many addresses of a process.
+///
+/// Addresses are sorted and merged into runs of adjacent slots so every run is
+/// written at once; on Linux the runs are additionally batched into
+/// `process_vm_writev` calls.
+///
+/// Returns the number of addresses that were written.
+pub fn write_process_memory_batch(proc: &ProcessHandle, addresses: &[usize], buf: &[u8]) -> usize {
+    #[cfg(windows)]
+    return windows::process::write_process_memory_batch(proc, addresses, buf);
+    #[cfg(unix)]
+    return linux::process::write_process_memory_batch(proc, addresses, buf);
+}
+
+/// Upper bound on the number of values merged into a single [`WriteRun`]
+pub(crate) const WRITE_RUN_MAX_VALUES: usize = 4096;
+
+/// A run of `count` adjacent slots starting at `addr`, all written with the same value
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) struct WriteRun {
+    pub addr: usize,
+    pub count: usize,
+}
+
+/// Sort and deduplicate `addresses` and merge the ones exactly `width` bytes
+/// apart into runs of at most [`WRITE_RUN_MAX_VALUES`] slots.
+pub(crate) fn coalesce_write_runs(addresses: &[usize], width: usize) -> Vec<WriteRun> {
+    let mut sorted = addresses.to_vec();
+    sorted.sort_unstable();
+    sorted.dedup();
+
+    let mut runs: Vec<WriteRun> = Vec::new();
+    for addr in sorted {
+        if let Some(run) = runs.last_mut() {
+            if run.count < WRITE_RUN_MAX_VALUES && run.addr + run.count * width == addr {
+                run.count += 1;
+                continue;
+            }
+        }
+        runs.push(WriteRun { addr, count: 1 });
+    }
+    runs
+}
+
 // ================= Cross-platform structures ==================
 
 /// Cross-platform system information about the target process environment.
@@ -236,3 +280,44 @@ pub fn is_region_interesting(prot: &MemoryProtection, state: &MemoryState) -> bo
         true
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_coalesce_write_runs() {
+        let runs = coalesce_write_runs(&[0x1008, 0x1000, 0x1004, 0x1004, 0x2000, 0x2002], 4);
+        assert_eq!(
+            runs,
+            vec![
+                WriteRun {
+                    addr: 0x1000,
+                    count: 3
+                },
+                WriteRun {
+                    addr: 0x2000,
+                    count: 1
+                },
+                WriteRun {
+                    addr: 0x2002,
+                    count: 1
+                },
+            ]
+        );
+    }
+
+    #[test]
+    fn test_coalesce_write_runs_caps_run_length() {
+        let addresses: Vec<usize> = (0..WRITE_RUN_MAX_VALUES + 1).collect();
+        let runs = coalesce_write_runs(&addresses, 1);
+        assert_eq!(runs.len(), 2);
+        assert_eq!(
+            runs[1],
+            WriteRun {
+                addr: WRITE_RUN_MAX_VALUES,
+                count: 1
+            }
+        );
+    }
+}
@@ -3,6 +3,7 @@
 use crate::memmap::{MappedMemory, MemoryMapper};
 use crate::process::ProcessHandle;
 use crate::process::{MemoryRegion, MemoryRegionIterator, SystemInfo};
+use crate::simd;
 use anyhow::Result;
 use memchr::memmem;
 use owo_colors::OwoColorize;
@@ -13,10 +14,14 @@ pub struct ScanOptions {
 }
 
 /// Perform static, single-pass scan all readable regions.
+///
+/// `mask` has one byte per pattern byte: `0xFF` for literal bytes and `0x00`
+/// for wildcards (see [`crate::parse_hex_pattern_masked`]).
 pub fn scan_process(
     proc: &ProcessHandle,
     sys: &SystemInfo,
     pattern: &[u8],
+    mask: &[u8],
     opts: &ScanOptions,
     modules: &[MemoryRegion],
 ) -> Result<()> {
@@ -113,7 +118,7 @@ pub fn scan_process(
     // Now scan all mapped regions
     for mapped in memory_mapper.into_iter() {
         total_bytes += mapped.remote_region.size;
-        let matches = scan_region(&mapped, pattern, opts)?;
+        let matches = scan_region(&mapped, pattern, mask, opts)?;
         matches_found += matches;
     }
 
@@ -128,22 +133,20 @@ pub fn scan_process(
     Ok(())
 }
 
-pub fn scan_region(mapped: &MappedMemory, pattern: &[u8], opts: &ScanOptions) -> Result<usize> {
-    let mut matches_found = 0usize;
-    let mut prev_off = 0;
+pub fn scan_region(
+    mapped: &MappedMemory,
+    pattern: &[u8],
+    mask: &[u8],
+    opts: &ScanOptions,
+) -> Result<usize> {
     let haystack = mapped.data();
-    while prev_off < haystack.len() {
-        if let Some(rel_off) = optimized_search(&haystack[prev_off..], pattern) {
-            let match_address = mapped.remote_region.base_address + prev_off + rel_off;
-            print_match_context(match_address, haystack, pattern, prev_off, rel_off, opts);
-            matches_found += 1;
-
-            prev_off += rel_off + 1; // continue searching after this match
-        } else {
-            break;
-        }
+    // All (overlapping) matches in one SIMD pass over the region
+    let offsets = simd::find_pattern_masked(haystack, pattern, mask);
+    for &offset in &offsets {
+        let match_address = mapped.remote_region.base_address + offset;
+        print_match_context(match_address, haystack, pattern, 0, offset, opts);
     }
-    Ok(matches_found)
+    Ok(offsets.len())
 }
 
 fn print_match_context(
@@ -0,0 +1,645 @@
+//! SIMD kernels for scanning, filtering and pattern parsing
+//!
+//! Column kernels operate on contiguous little-endian byte buffers holding one
+//! `width`-byte element per slot (as produced by the interactive scanner).
+//! On x86_64 the vector implementation is selected at runtime; every kernel has
+//! a portable scalar fallback that produces identical results.
+
+use memchr::memmem;
+#[cfg(target_arch = "x86_64")]
+use std::arch::x86_64::*;
+
+/// Compare two packed columns element by element and return the indices of the
+/// elements that are bitwise equal (`equal = true`) or different (`equal = false`).
+///
+/// `width` is the element size in bytes and must be 1, 2, 4 or 8.
+pub fn select_equal(a: &[u8], b: &[u8], width: usize, equal: bool) -> Vec<u32> {
+    assert!(
+        matches!(width, 1 | 2 | 4 | 8),
+        "unsupported element width {}",
+        width
+    );
+    assert_eq!(a.len(), b.len(), "columns must have the same length");
+    assert_eq!(
+        a.len() % width,
+        0,
+        "column length must be a multiple of the width"
+    );
+
+    let mut out = Vec::new();
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("avx2") {
+        // SAFETY: AVX2 support was just checked
+        unsafe { select_equal_avx2(a, b, width, equal, &mut out) };
+        return out;
+    }
+    select_equal_scalar(a, b, width, equal, 0, &mut out);
+    out
+}
+
+/// Scalar kernel for [`select_equal`], starting at byte offset `start`
+fn select_equal_scalar(
+    a: &[u8],
+    b: &[u8],
+    width: usize,
+    equal: bool,
+    start: usize,
+    out: &mut Vec<u32>,
+) {
+    let first = start / width;
+    let pairs = a[start..]
+        .chunks_exact(width)
+        .zip(b[start..].chunks_exact(width));
+    for (i, (x, y)) in pairs.enumerate() {
+        if (x == y) == equal {
+            out.push((first + i) as u32);
+        }
+    }
+}
+
+/// Reduce a per-byte equality mask to one bit per `width`-byte element.
+///
+/// The resulting bit for an element sits at the position of its first byte and is
+/// set only if all of its bytes compared equal.
+#[inline(always)]
+fn element_mask(bytes: u32, width: usize) -> u32 {
+    match width {
+        1 => bytes,
+        2 => bytes & (bytes >> 1) & 0x5555_5555,
+        4 => {
+            let pairs = bytes & (bytes >> 1);
+            pairs & (pairs >> 2) & 0x1111_1111
+        }
+        _ => {
+            let pairs = bytes & (bytes >> 1);
+            let quads = pairs & (pairs >> 2);
+            quads & (quads >> 4) & 0x0101_0101
+        }
+    }
+}
+
+/// Bits of [`element_mask`] that correspond to element boundaries
+#[inline(always)]
+fn element_lanes(width: usize) -> u32 {
+    match width {
+        1 => u32::MAX,
+        2 => 0x5555_5555,
+        4 => 0x1111_1111,
+        _ => 0x0101_0101,
+    }
+}
+
+/// Push the element indices for every set bit of `lanes`, a mask over the
+/// 32-byte block starting at byte offset `base`
+#[inline(always)]
+fn push_lanes(mut lanes: u32, base: usize, width: usize, out: &mut Vec<u32>) {
+    while lanes != 0 {
+        let bit = lanes.trailing_zeros() as usize;
+        out.push(((base + bit) / width) as u32);
+        lanes &= lanes - 1;
+    }
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn select_equal_avx2(a: &[u8], b: &[u8], width: usize, equal: bool, out: &mut Vec<u32>) {
+    const BLOCK: usize = 32;
+    let lanes_all = element_lanes(width);
+    let mut offset = 0;
+
+    while offset + BLOCK <= a.len() {
+        // SAFETY: `offset + BLOCK <= len` for both columns; loads are unaligned
+        let eq_bytes = unsafe {
+            let va = _mm256_loadu_si256(a.as_ptr().add(offset) as *const __m256i);
+            let vb = _mm256_loadu_si256(b.as_ptr().add(offset) as *const __m256i);
+            _mm256_movemask_epi8(_mm256_cmpeq_epi8(va, vb)) as u32
+        };
+        let eq_lanes = element_mask(eq_bytes, width);
+        let lanes = if equal {
+            eq_lanes
+        } else {
+            !eq_lanes & lanes_all
+        };
+        push_lanes(lanes, offset, width, out);
+        offset += BLOCK;
+    }
+
+    select_equal_scalar(a, b, width, equal, offset, out);
+}
+
+/// Find every naturally aligned element of `haystack` equal to `needle`.
+///
+/// `haystack` is treated as packed `needle.len()`-byte elements (1, 2, 4 or 8);
+/// the returned values are element indices, so the byte offset of a hit is
+/// `index * needle.len()`. A trailing partial element is ignored.
+pub fn find_equal(haystack: &[u8], needle: &[u8]) -> Vec<usize> {
+    let width = needle.len();
+    assert!(
+        matches!(width, 1 | 2 | 4 | 8),
+        "unsupported element width {}",
+        width
+    );
+
+    let mut out = Vec::new();
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("avx2") {
+        // SAFETY: AVX2 support was just checked
+        unsafe { find_equal_avx2(haystack, needle, &mut out) };
+        return out;
+    }
+    find_equal_scalar(haystack, needle, 0, &mut out);
+    out
+}
+
+/// Scalar kernel for [`find_equal`], starting at byte offset `start`
+fn find_equal_scalar(haystack: &[u8], needle: &[u8], start: usize, out: &mut Vec<usize>) {
+    let first = start / needle.len();
+    for (i, element) in haystack[start..].chunks_exact(needle.len()).enumerate() {
+        if element == needle {
+            out.push(first + i);
+        }
+    }
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn find_equal_avx2(haystack: &[u8], needle: &[u8], out: &mut Vec<usize>) {
+    const BLOCK: usize = 32;
+    let width = needle.len();
+
+    // Broadcast the needle across a whole vector
+    let mut pattern = [0u8; BLOCK];
+    for chunk in pattern.chunks_exact_mut(width) {
+        chunk.copy_from_slice(needle);
+    }
+    // SAFETY: `pattern` is exactly one vector wide
+    let splat = unsafe { _mm256_loadu_si256(pattern.as_ptr() as *const __m256i) };
+
+    let mut offset = 0;
+    while offset + BLOCK <= haystack.len() {
+        // SAFETY: `offset + BLOCK <= len`; the load is unaligned
+        let eq_bytes = unsafe {
+            let v = _mm256_loadu_si256(haystack.as_ptr().add(offset) as *const __m256i);
+            _mm256_movemask_epi8(_mm256_cmpeq_epi8(v, splat)) as u32
+        };
+        let mut lanes = element_mask(eq_bytes, width);
+        while lanes != 0 {
+            let bit = lanes.trailing_zeros() as usize;
+            out.push((offset + bit) / width);
+            lanes &= lanes - 1;
+        }
+        offset += BLOCK;
+    }
+
+    find_equal_scalar(haystack, needle, offset, out);
+}
+
+/// Find every offset at which `pattern` occurs in `haystack`, including
+/// overlapping occurrences, in increasing order.
+///
+/// The AVX2 kernel compares the first and last pattern byte against 32
+/// candidate positions at once and only verifies the interior of candidates
+/// that pass both checks.
+pub fn find_pattern(haystack: &[u8], pattern: &[u8]) -> Vec<usize> {
+    let mut out = Vec::new();
+    if pattern.is_empty() || pattern.len() > haystack.len() {
+        return out;
+    }
+    if pattern.len() == 1 {
+        out.extend(memchr::memchr_iter(pattern[0], haystack));
+        return out;
+    }
+
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("avx2") {
+        // SAFETY: AVX2 support was just checked
+        unsafe { find_pattern_avx2(haystack, pattern, &mut out) };
+        return out;
+    }
+    find_pattern_scalar(haystack, pattern, 0, &mut out);
+    out
+}
+
+/// Scalar kernel for [`find_pattern`], reporting matches starting at or after `start`
+fn find_pattern_scalar(haystack: &[u8], pattern: &[u8], start: usize, out: &mut Vec<usize>) {
+    let finder = memmem::Finder::new(pattern);
+    let mut offset = start;
+    while offset < haystack.len() {
+        match finder.find(&haystack[offset..]) {
+            Some(rel) => {
+                out.push(offset + rel);
+                offset += rel + 1;
+            }
+            None => break,
+        }
+    }
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn find_pattern_avx2(haystack: &[u8], pattern: &[u8], out: &mut Vec<usize>) {
+    const BLOCK: usize = 32;
+    let last = pattern.len() - 1;
+    let interior = &pattern[1..last];
+    let first_splat = _mm256_set1_epi8(pattern[0] as i8);
+    let last_splat = _mm256_set1_epi8(pattern[last] as i8);
+
+    let mut offset = 0;
+    while offset + last + BLOCK <= haystack.len() {
+        // SAFETY: `offset + last + BLOCK <= len`, so both unaligned loads are in bounds
+        let mut candidates = unsafe {
+            let ptr = haystack.as_ptr().add(offset);
+            let head = _mm256_loadu_si256(ptr as *const __m256i);
+            let tail = _mm256_loadu_si256(ptr.add(last) as *const __m256i);
+            let hits = _mm256_and_si256(
+                _mm256_cmpeq_epi8(head, first_splat),
+                _mm256_cmpeq_epi8(tail, last_splat),
+            );
+            _mm256_movemask_epi8(hits) as u32
+        };
+        while candidates != 0 {
+            let start = offset + candidates.trailing_zeros() as usize;
+            if &haystack[start + 1..start + last] == interior {
+                out.push(start);
+            }
+            candidates &= candidates - 1;
+        }
+        offset += BLOCK;
+    }
+
+    find_pattern_scalar(haystack, pattern, offset, out);
+}
+
+/// Like [`find_pattern`], but only pattern bytes whose `mask` byte is `0xFF`
+/// have to match; bytes with a `0x00` mask are wildcards.
+///
+/// Candidates are filtered on the first and last literal pattern byte, so
+/// wildcards cost nothing in the vector loop. A pattern without any literal
+/// byte matches at every offset.
+pub fn find_pattern_masked(haystack: &[u8], pattern: &[u8], mask: &[u8]) -> Vec<usize> {
+    assert_eq!(
+        pattern.len(),
+        mask.len(),
+        "pattern and mask must have the same length"
+    );
+    if mask.iter().all(|&m| m == 0xFF) {
+        return find_pattern(haystack, pattern);
+    }
+
+    let mut out = Vec::new();
+    if pattern.is_empty() || pattern.len() > haystack.len() {
+        return out;
+    }
+    let Some(first) = mask.iter().position(|&m| m != 0) else {
+        out.extend(0..=haystack.len() - pattern.len());
+        return out;
+    };
+    let last = mask.iter().rposition(|&m| m != 0).unwrap_or(first);
+
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("avx2") {
+        // SAFETY: AVX2 support was just checked
+        unsafe { find_pattern_masked_avx2(haystack, pattern, mask, first, last, &mut out) };
+        return out;
+    }
+    find_pattern_masked_scalar(haystack, pattern, mask, first, 0, &mut out);
+    out
+}
+
+/// Whether `window` matches `pattern` on every byte selected by `mask`
+#[inline(always)]
+fn matches_masked(window: &[u8], pattern: &[u8], mask: &[u8]) -> bool {
+    window
+        .iter()
+        .zip(pattern)
+        .zip(mask)
+        .all(|((&h, &p), &m)| (h ^ p) & m == 0)
+}
+
+/// Scalar kernel for [`find_pattern_masked`], reporting matches starting at or
+/// after `start`. `first` is the offset of the first literal pattern byte.
+fn find_pattern_masked_scalar(
+    haystack: &[u8],
+    pattern: &[u8],
+    mask: &[u8],
+    first: usize,
+    start: usize,
+    out: &mut Vec<usize>,
+) {
+    let end = haystack.len() - pattern.len();
+    if start > end {
+        return;
+    }
+    // Candidates are the positions of the first literal byte
+    let anchors = &haystack[start + first..=end + first];
+    for hit in memchr::memchr_iter(pattern[first], anchors) {
+        let offset = start + hit;
+        if matches_masked(&haystack[offset..offset + pattern.len()], pattern, mask) {
+            out.push(offset);
+        }
+    }
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn find_pattern_masked_avx2(
+    haystack: &[u8],
+    pattern: &[u8],
+    mask: &[u8],
+    first: usize,
+    last: usize,
+    out: &mut Vec<usize>,
+) {
+    const BLOCK: usize = 32;
+    let len = pattern.len();
+    let first_splat = _mm256_set1_epi8(pattern[first] as i8);
+    let last_splat = _mm256_set1_epi8(pattern[last] as i8);
+
+    let mut offset = 0;
+    while offset + len - 1 + BLOCK <= haystack.len() {
+        // SAFETY: `offset + len - 1 + BLOCK <= len` and `first <= last < len`, so
+        // both unaligned loads and every candidate window are in bounds
+        let mut candidates = unsafe {
+            let ptr = haystack.as_ptr().add(offset);
+            let head = _mm256_loadu_si256(ptr.add(first) as *const __m256i);
+            let tail = _mm256_loadu_si256(ptr.add(last) as *const __m256i);
+            let hits = _mm256_and_si256(
+                _mm256_cmpeq_epi8(head, first_splat),
+                _mm256_cmpeq_epi8(tail, last_splat),
+            );
+            _mm256_movemask_epi8(hits) as u32
+        };
+        while candidates != 0 {
+            let start = offset + candidates.trailing_zeros() as usize;
+            if matches_masked(&haystack[start..start + len], pattern, mask) {
+                out.push(start);
+            }
+            candidates &= candidates - 1;
+        }
+        offset += BLOCK;
+    }
+
+    find_pattern_masked_scalar(haystack, pattern, mask, first, offset, out);
+}
+
+/// Decode leading 16-digit blocks of ASCII hex digits (no whitespace) into `out`.
+///
+/// Returns the number of digits consumed, which is a multiple of 16. Decoding
+/// stops before the first block containing a non-hex byte, and no digits are
+/// consumed when no SIMD implementation is available; the caller decodes the
+/// remainder.
+pub fn decode_hex_prefix(digits: &[u8], out: &mut Vec<u8>) -> usize {
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("ssse3") {
+        // SAFETY: SSSE3 support was just checked
+        return unsafe { decode_hex_ssse3(digits, out) };
+    }
+    let _ = (digits, out);
+    0
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "ssse3")]
+unsafe fn decode_hex_ssse3(digits: &[u8], out: &mut Vec<u8>) -> usize {
+    const BLOCK: usize = 16;
+    let below_zero = _mm_set1_epi8(b'0' as i8 - 1);
+    let above_nine = _mm_set1_epi8(b'9' as i8 + 1);
+    let below_a = _mm_set1_epi8(b'a' as i8 - 1);
+    let above_f = _mm_set1_epi8(b'f' as i8 + 1);
+    let lowercase = _mm_set1_epi8(0x20);
+    let digit_bias = _mm_set1_epi8(b'0' as i8);
+    let alpha_bias = _mm_set1_epi8(b'a' as i8 - 10);
+    // maddubs weights per byte pair: high nibble * 16 + low nibble * 1
+    let weights = _mm_set1_epi16(0x0110);
+    let mut offset = 0;
+
+    while offset + BLOCK <= digits.len() {
+        // SAFETY: `offset + BLOCK <= len`; the load is unaligned
+        let v = unsafe { _mm_loadu_si128(digits.as_ptr().add(offset) as *const __m128i) };
+        let lower = _mm_or_si128(v, lowercase);
+        // Signed compares also reject bytes >= 0x80
+        let is_digit = _mm_and_si128(_mm_cmpgt_epi8(v, below_zero), _mm_cmpgt_epi8(above_nine, v));
+        let is_alpha = _mm_and_si128(
+            _mm_cmpgt_epi8(lower, below_a),
+            _mm_cmpgt_epi8(above_f, lower),
+        );
+        if _mm_movemask_epi8(_mm_or_si128(is_digit, is_alpha)) != 0xFFFF {
+            break;
+        }
+
+        let nibbles = _mm_or_si128(
+            _mm_and_si128(is_digit, _mm_sub_epi8(v, digit_bias)),
+            _mm_and_si128(is_alpha, _mm_sub_epi8(lower, alpha_bias)),
+        );
+        let pairs = _mm_maddubs_epi16(nibbles, weights);
+        let packed = _mm_packus_epi16(pairs, pairs);
+
+        let mut block = [0u8; BLOCK / 2];
+        // SAFETY: `block` holds exactly the 8 bytes stored
+        unsafe { _mm_storel_epi64(block.as_mut_ptr() as *mut __m128i, packed) };
+        out.extend_from_slice(&block);
+        offset += BLOCK;
+    }
+
+    offset
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn pack_i32(values: &[i32]) -> Vec<u8> {
+        values.iter().flat_map(|v| v.to_le_bytes()).collect()
+    }
+
+    #[test]
+    fn test_select_equal_i32() {
+        let a = pack_i32(&[1, 2, 3, 4, 5]);
+        let b = pack_i32(&[1, 9, 3, 8, 5]);
+        assert_eq!(select_equal(&a, &b, 4, true), vec![0, 2, 4]);
+        assert_eq!(select_equal(&a, &b, 4, false), vec![1, 3]);
+    }
+
+    #[test]
+    fn test_select_equal_partial_element_change() {
+        // Only the high byte of the second element differs
+        let a = pack_i32(&[0x0100_0000, 0x0100_0000]);
+        let b = pack_i32(&[0x0100_0000, 0x0200_0000]);
+        assert_eq!(select_equal(&a, &b, 4, false), vec![1]);
+    }
+
+    #[test]
+    fn test_select_equal_matches_scalar() {
+        // Long enough to exercise full SIMD blocks plus a scalar tail
+        let a: Vec<u8> = (0..1000u32).map(|i| (i * 7 % 251) as u8).collect();
+        let mut b = a.clone();
+        for i in (0..b.len()).step_by(13) {
+            b[i] ^= 0x5A;
+        }
+
+        for width in [1, 2, 4, 8] {
+            let len = a.len() / width * width;
+            for equal in [true, false] {
+                let mut expected = Vec::new();
+                select_equal_scalar(&a[..len], &b[..len], width, equal, 0, &mut expected);
+                assert_eq!(
+                    select_equal(&a[..len], &b[..len], width, equal),
+                    expected,
+                    "width {} equal {}",
+                    width,
+                    equal
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn test_select_equal_empty() {
+        assert!(select_equal(&[], &[], 8, true).is_empty());
+    }
+
+    #[test]
+    fn test_find_equal_i32() {
+        let haystack = pack_i32(&[7, 1, 7, 7, 0x0007_0000, 3, 7]);
+        assert_eq!(find_equal(&haystack, &7i32.to_le_bytes()), vec![0, 2, 3, 6]);
+    }
+
+    #[test]
+    fn test_find_equal_matches_scalar() {
+        let haystack: Vec<u8> = (0..1003u32).map(|i| (i % 3) as u8).collect();
+        for needle in [
+            &[0u8][..],
+            &[1, 2],
+            &[0, 1, 2, 0],
+            &[2, 0, 1, 2, 0, 1, 2, 0],
+        ] {
+            let mut expected = Vec::new();
+            find_equal_scalar(&haystack, needle, 0, &mut expected);
+            assert!(!expected.is_empty());
+            assert_eq!(
+                find_equal(&haystack, needle),
+                expected,
+                "needle {:?}",
+                needle
+            );
+        }
+    }
+
+    #[test]
+    fn test_find_pattern_overlapping() {
+        assert_eq!(find_pattern(b"aaaa", b"aa"), vec![0, 1, 2]);
+        assert_eq!(
+            find_pattern(b"\x4D\x5A\x90\x00\x4D\x5A", b"\x4D\x5A"),
+            vec![0, 4]
+        );
+        assert!(find_pattern(b"ab", b"abc").is_empty());
+        assert!(find_pattern(b"ab", b"").is_empty());
+    }
+
+    #[test]
+    fn test_find_pattern_matches_naive() {
+        let haystack: Vec<u8> = (0..5000u32).map(|i| (i * i % 7) as u8).collect();
+        for pattern in [
+            &[0u8][..],
+            &[1, 4],
+            &[2, 2, 4],
+            &[4, 1, 0, 1, 4, 2, 2, 4, 1],
+        ] {
+            let expected: Vec<usize> = haystack
+                .windows(pattern.len())
+                .enumerate()
+                .filter(|(_, window)| window == &pattern)
+                .map(|(i, _)| i)
+                .collect();
+            assert!(!expected.is_empty());
+            assert_eq!(
+                find_pattern(&haystack, pattern),
+                expected,
+                "pattern {:?}",
+                pattern
+            );
+
+            let mut scalar = Vec::new();
+            find_pattern_scalar(&haystack, pattern, 0, &mut scalar);
+            assert_eq!(scalar, expected, "pattern {:?}", pattern);
+        }
+    }
+
+    #[test]
+    fn test_find_pattern_masked() {
+        let haystack = b"\x4D\x5A\x90\x00\x4D\x11\x90\x22\x4D";
+        let pattern = [0x4D, 0x00, 0x90];
+        assert_eq!(
+            find_pattern_masked(haystack, &pattern, &[0xFF, 0x00, 0xFF]),
+            vec![0, 4]
+        );
+        assert_eq!(
+            find_pattern_masked(haystack, &pattern, &[0xFF; 3]),
+            Vec::<usize>::new()
+        );
+        // Leading/trailing wildcards and all-wildcard patterns
+        assert_eq!(
+            find_pattern_masked(haystack, &[0, 0x90], &[0x00, 0xFF]),
+            vec![1, 5]
+        );
+        assert_eq!(find_pattern_masked(b"abc", &[0, 0], &[0, 0]), vec![0, 1]);
+    }
+
+    #[test]
+    fn test_find_pattern_masked_matches_naive() {
+        let haystack: Vec<u8> = (0..5000u32).map(|i| (i * i % 7) as u8).collect();
+        // Longer than a vector, with every third byte a wildcard
+        let long_pattern = haystack[100..140].to_vec();
+        let long_mask: Vec<u8> = (0..40)
+            .map(|i| if i % 3 == 1 { 0x00 } else { 0xFF })
+            .collect();
+        let cases: [(&[u8], &[u8]); 4] = [
+            (&[0, 9, 4], &[0xFF, 0x00, 0xFF]),
+            (&[9, 2, 2], &[0x00, 0xFF, 0xFF]),
+            (
+                &[4, 1, 0, 9, 9, 2, 2, 9],
+                &[0xFF, 0xFF, 0xFF, 0, 0, 0xFF, 0xFF, 0],
+            ),
+            (&long_pattern, &long_mask),
+        ];
+        for (pattern, mask) in cases {
+            let expected: Vec<usize> = haystack
+                .windows(pattern.len())
+                .enumerate()
+                .filter(|(_, window)| matches_masked(window, pattern, mask))
+                .map(|(i, _)| i)
+                .collect();
+            assert!(!expected.is_empty());
+            assert_eq!(find_pattern_masked(&haystack, pattern, mask), expected);
+
+            let first = mask.iter().position(|&m| m != 0).unwrap();
+            let mut scalar = Vec::new();
+            find_pattern_masked_scalar(&haystack, pattern, mask, first, 0, &mut scalar);
+            assert_eq!(scalar, expected);
+        }
+    }
+
+    #[test]
+    fn test_decode_hex_prefix() {
+        let digits = b"0123456789abcdefABCDEF0123456789ff";
+        let mut out = Vec::new();
+        let consumed = decode_hex_prefix(digits, &mut out);
+        assert_eq!(consumed % 16, 0);
+        assert!(consumed <= 32);
+        let expected = [
+            0x01, 0x23, 0x45, 0x67, 0x89, 0xAB, 0xCD, 0xEF, 0xAB, 0xCD, 0xEF, 0x01, 0x23, 0x45,
+            0x67, 0x89,
+        ];
+        assert_eq!(out, &expected[..consumed / 2]);
+    }
+
+    #[test]
+    fn test_decode_hex_prefix_stops_at_invalid_block() {
+        let mut digits = b"00112233445566778899aabbccddeeff".to_vec();
+        for bad in [b'g', b'G', b'/', b':', b'@', b'`', 0x80, 0xFF] {
+            digits[20] = bad;
+            let mut out = Vec::new();
+            assert!(decode_hex_prefix(&digits, &mut out) <= 16);
+        }
+    }
+}
@@ -30,6 +30,11 @@ impl ValueType {
             ValueType::I64 | ValueType::U64 | ValueType::F64 => 8,
         }
     }
+
+    /// Whether this is a floating point type
+    pub fn is_float(&self) -> bool {
+        matches!(self, ValueType::F32 | ValueType::F64)
+    }
 }
 
 /// A value read from memory that can be one of several types
@@ -48,6 +53,22 @@ pub enum Value {
 }
 
 impl Value {
+    /// Get the type of this value
+    pub fn value_type(&self) -> ValueType {
+        match self {
+            Value::I8(_) => ValueType::I8,
+            Value::I16(_) => ValueType::I16,
+            Value::I32(_) => ValueType::I32,
+            Value::I64(_) => ValueType::I64,
+            Value::U8(_) => ValueType::U8,
+            Value::U16(_) => ValueType::U16,
+            Value::U32(_) => ValueType::U32,
+            Value::U64(_) => ValueType::U64,
+            Value::F32(_) => ValueType::F32,
+            Value::F64(_) => ValueType::F64,
+        }
+    }
+
     /// Read a value from bytes at the given offset
     pub fn from_bytes(bytes: &[u8], offset: usize, value_type: ValueType) -> Option<Self> {
         if offset + value_type.size() > bytes.len() {
@@ -275,6 +296,13 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_value_type_of_value() {
+        assert_eq!(Value::I32(1).value_type(), ValueType::I32);
+        assert_eq!(Value::U8(1).value_type(), ValueType::U8);
+        assert_eq!(Value::F64(1.0).value_type(), ValueType::F64);
+    }
+
     #[test]
     fn test_value_to_bytes() {
         let val = Value::I32(0x42);
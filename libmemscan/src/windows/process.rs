@@ -1,6 +1,6 @@
 use crate::process::{
     MemoryProtection, MemoryRegion, MemoryState, MemoryType, ProcessHandle, SystemInfo,
-    is_region_interesting,
+    coalesce_write_runs, is_region_interesting,
 };
 use anyhow::Result;
 use std::mem::{MaybeUninit, size_of, transmute};
@@ -330,3 +330,24 @@ pub(crate) fn write_process_memory(proc: &ProcessHandleWin, addr: usize, buf: &[
         if res == 0 { 0 } else { bytes_written as usize }
     }
 }
+
+/// Write `buf` to every address, one `WriteProcessMemory` call per run of adjacent addresses
+pub(crate) fn write_process_memory_batch(
+    proc: &ProcessHandleWin,
+    addresses: &[usize],
+    buf: &[u8],
+) -> usize {
+    let width = buf.len();
+    if width == 0 {
+        return 0;
+    }
+
+    let runs = coalesce_write_runs(addresses, width);
+    let fill = buf.repeat(runs.iter().map(|run| run.count).max().unwrap_or(0));
+
+    let mut written = 0;
+    for run in runs {
+        written += write_process_memory(proc, run.addr, &fill[..run.count * width]) / width;
+    }
+    written
+}
@@ -19,10 +19,208 @@ Example usage:
     ...     print(f"Found {len(modules)} module regions")
 """
 
+import functools
+import math
+import operator
+import time
+import weakref
+
 # Import the native Rust module
 from .memscan import *
 
 __version__ = "0.1.0"
+
+# System info is fixed for the lifetime of the process, so query it only once
+_raw_query_system_info = query_system_info
+query_system_info = functools.lru_cache(maxsize=1)(_raw_query_system_info)
+
+# Module regions per open process handle; entries go away with the handle
+_raw_get_process_module_regions = get_process_module_regions
+_module_regions_cache = weakref.WeakKeyDictionary()
+
+
+def get_process_module_regions(handle):
+    """Get the module regions of a process, cached per process handle.
+
+    Returns a new list on every call, so callers may modify it freely.
+    """
+    regions = _module_regions_cache.get(handle)
+    if regions is None:
+        regions = _raw_get_process_module_regions(handle)
+        _module_regions_cache[handle] = regions
+    return list(regions)
+
+
+# PIDs found by name, reused for a short while so retrying the same name does
+# not walk every process again. Misses are not cached, so a process started
+# right after a failed lookup is found on the next try. Entries are kept in
+# lookup order, oldest first.
+_raw_find_process_by_name = find_process_by_name
+_FIND_PROCESS_TTL = 2.0
+_FIND_PROCESS_CACHE_SIZE = 64
+_find_process_cache = {}
+
+
+def find_process_by_name(name):
+    """Find a process PID by name, reusing a PID found within the last two seconds."""
+    now = time.monotonic()
+    hit = _find_process_cache.get(name)
+    if hit is not None and now - hit[0] < _FIND_PROCESS_TTL:
+        return hit[1]
+
+    pid = _raw_find_process_by_name(name)
+    _find_process_cache.pop(name, None)
+
+    # Drop expired entries, then the oldest ones if the cache is still full
+    while _find_process_cache:
+        oldest = next(iter(_find_process_cache))
+        expired = now - _find_process_cache[oldest][0] >= _FIND_PROCESS_TTL
+        if not expired and len(_find_process_cache) < _FIND_PROCESS_CACHE_SIZE:
+            break
+        del _find_process_cache[oldest]
+
+    if pid is not None:
+        _find_process_cache[name] = (now, pid)
+    return pid
+
+
+# NumPy dtypes matching the packed little-endian layout of `match_values_buffer()`
+_NUMPY_DTYPES = {
+    "i8": "<i1",
+    "i16": "<i2",
+    "i32": "<i4",
+    "i64": "<i8",
+    "u8": "<u1",
+    "u16": "<u2",
+    "u32": "<u4",
+    "u64": "<u8",
+    "f32": "<f4",
+    "f64": "<f8",
+}
+
+
+# NumPy comparison ufuncs for the bulk filter operators
+_NUMPY_OPS = {"eq": "equal", "lt": "less", "gt": "greater"}
+
+# Numba kernels module once probed; False if Numba is unavailable
+_kernels = None
+
+
+def match_values(scanner):
+    """Return the current values of all matches as a typed NumPy array.
+
+    Requires NumPy. The array wraps the buffer returned by the scanner
+    without copying; index ``i`` corresponds to ``scanner.get_matches()[i]``.
+    """
+    import numpy as np
+
+    buf = scanner.match_values_buffer()
+    return np.frombuffer(buf, dtype=_NUMPY_DTYPES[scanner.value_type])
+
+
+def match_addresses(scanner):
+    """Return the addresses of all matches as a ``uint64`` NumPy array.
+
+    Aligned with :func:`match_values`; avoids building a ``PyMatchedAddress``
+    per match.
+    """
+    import numpy as np
+
+    return np.frombuffer(scanner.addresses_buffer(), dtype="<u8")
+
+
+def scanned_values(scanner):
+    """Return the values recorded by the last scan/filter step as a NumPy array.
+
+    These are the values ``filter_increased``/``filter_decreased`` compare the
+    current values against, aligned with :func:`match_values`.
+    """
+    import numpy as np
+
+    buf = scanner.scanned_values_buffer()
+    return np.frombuffer(buf, dtype=_NUMPY_DTYPES[scanner.value_type])
+
+
+def _load_kernels():
+    global _kernels
+    if _kernels is None:
+        try:
+            from . import _numba_kernels as kernels
+        except ImportError:
+            kernels = False
+        _kernels = kernels
+    return _kernels or None
+
+
+def _select(values, op, operand):
+    """Indices of ``values`` satisfying ``values <op> operand``, as uint32"""
+    import numpy as np
+
+    kernels = _load_kernels()
+    if kernels is not None:
+        return kernels.select(values, op, operand)
+
+    mask = getattr(np, _NUMPY_OPS[op])(values, operand)
+    return np.ascontiguousarray(np.flatnonzero(mask), dtype=np.uint32)
+
+
+def _operand(dtype, value):
+    """``value`` as a ``dtype`` scalar, converted like the scalar filters do.
+
+    Integers are used as-is when they fit. Anything else goes through
+    ``float`` and is truncated. Out-of-range values saturate to the type's
+    bounds, and NaN becomes 0.
+    """
+    import numpy as np
+
+    if dtype.kind == "f":
+        return dtype.type(value)
+
+    try:
+        value = operator.index(value)
+    except TypeError:
+        value = float(value)
+        if math.isnan(value):
+            value = 0.0
+    info = np.iinfo(dtype)
+    return dtype.type(int(min(max(value, info.min), info.max)))
+
+
+def _filter_bulk(scanner, op, value):
+    values = match_values(scanner)
+    return scanner.apply_index_mask(_select(values, op, _operand(values.dtype, value)))
+
+
+def _filter_bulk_relative(scanner, op):
+    values = match_values(scanner)
+    return scanner.apply_index_mask(_select(values, op, scanned_values(scanner)))
+
+
+def filter_eq_bulk(scanner, value):
+    """Vectorized equivalent of ``scanner.filter_eq(value)``"""
+    return _filter_bulk(scanner, "eq", value)
+
+
+def filter_lt_bulk(scanner, value):
+    """Vectorized equivalent of ``scanner.filter_lt(value)``"""
+    return _filter_bulk(scanner, "lt", value)
+
+
+def filter_gt_bulk(scanner, value):
+    """Vectorized equivalent of ``scanner.filter_gt(value)``"""
+    return _filter_bulk(scanner, "gt", value)
+
+
+def filter_increased_bulk(scanner):
+    """Vectorized equivalent of ``scanner.filter_increased()``"""
+    return _filter_bulk_relative(scanner, "gt")
+
+
+def filter_decreased_bulk(scanner):
+    """Vectorized equivalent of ``scanner.filter_decreased()``"""
+    return _filter_bulk_relative(scanner, "lt")
+
+
 __all__ = [
     # Functions
     "open_process",
@@ -30,13 +228,24 @@ __all__ = [
     "query_system_info",
     "get_process_module_regions",
     "parse_hex_pattern",
+    "parse_hex_pattern_masked",
     "read_process_memory",
     "write_process_memory",
     "create_interactive_scanner",
+    # NumPy helpers
+    "match_values",
+    "match_addresses",
+    "scanned_values",
+    "filter_eq_bulk",
+    "filter_lt_bulk",
+    "filter_gt_bulk",
+    "filter_increased_bulk",
+    "filter_decreased_bulk",
     # Classes
     "PyProcessHandle",
     "PyMemoryRegion",
     "PySystemInfo",
     "PyInteractiveScanner",
     "PyMatchedAddress",
+    "PyMatchIter",
 ]
@@ -0,0 +1,65 @@
+"""
+Numba-compiled selection kernels for the bulk filters
+
+Imported lazily by the bulk filter helpers in :mod:`memscan`. Importing this
+module raises ImportError when Numba is not installed, in which case the
+helpers fall back to plain NumPy.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Comparison operators understood by `select`
+OPS = {"eq": 0, "lt": 1, "gt": 2}
+
+# Elements per parallel work item in the count and write passes
+_CHUNK = 1 << 16
+
+
+@njit(inline="always")
+def _hit(value, operand, op):
+    if op == 0:
+        return value == operand
+    if op == 1:
+        return value < operand
+    return value > operand
+
+
+@njit(parallel=True, cache=True)
+def _select(values, operands, stride, op):
+    n = values.size
+    chunks = (n + _CHUNK - 1) // _CHUNK
+
+    # Pass 1: count hits per chunk in parallel
+    counts = np.zeros(chunks + 1, dtype=np.int64)
+    for c in prange(chunks):
+        start = c * _CHUNK
+        end = min(start + _CHUNK, n)
+        hits = 0
+        for i in range(start, end):
+            if _hit(values[i], operands[i * stride], op):
+                hits += 1
+        counts[c + 1] = hits
+
+    # Pass 2: every chunk writes its hits at its own offset, so no atomics
+    offsets = np.cumsum(counts)
+    out = np.empty(offsets[chunks], dtype=np.uint32)
+    for c in prange(chunks):
+        start = c * _CHUNK
+        end = min(start + _CHUNK, n)
+        j = offsets[c]
+        for i in range(start, end):
+            if _hit(values[i], operands[i * stride], op):
+                out[j] = i
+                j += 1
+    return out
+
+
+def select(values, op, operand):
+    """Return the uint32 indices of ``values`` for which ``values <op> operand``.
+
+    ``operand`` is either a scalar or an array with one element per value.
+    """
+    operands = np.ascontiguousarray(operand, dtype=values.dtype).reshape(-1)
+    stride = 1 if operands.size == values.size else 0
+    return _select(values, operands, stride, OPS[op])
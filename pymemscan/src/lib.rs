@@ -4,8 +4,10 @@
 //! functionality to Python scripts. The API is explicit and requires specialized
 //! function calls for fine-grained control.
 
+use pyo3::buffer::PyBuffer;
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::{PyByteArray, PyBytes};
 use std::collections::HashMap;
 
 use libmemscan::interactive::{FilterOp, InteractiveScanner, MatchedAddress};
@@ -16,7 +18,7 @@ use libmemscan::scanner::{self, ScanOptions};
 use libmemscan::values::{MathOp, Value, ValueType};
 
 /// Python wrapper for ProcessHandle
-#[pyclass]
+#[pyclass(weakref)]
 struct PyProcessHandle {
     handle: ProcessHandle,
 }
@@ -109,6 +111,47 @@ impl PyMatchedAddress {
     }
 }
 
+impl From<MatchedAddress> for PyMatchedAddress {
+    fn from(m: MatchedAddress) -> Self {
+        PyMatchedAddress {
+            address: m.address,
+            current_value: value_to_f64(&m.current_value),
+            previous_value: m.previous_value.as_ref().map(value_to_f64),
+        }
+    }
+}
+
+/// Iterator over the matches of a scanner, building one match per step
+///
+/// Reads the scanner's current matches on every step, so filtering while
+/// iterating continues at the same index of the filtered matches.
+#[pyclass]
+struct PyMatchIter {
+    scanner: Py<PyInteractiveScanner>,
+    index: usize,
+}
+
+#[pymethods]
+impl PyMatchIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<PyMatchedAddress>> {
+        let scanner = self.scanner.borrow(py);
+        let scanner = scanner
+            .scanner
+            .as_ref()
+            .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
+
+        let matched = scanner.match_at(self.index).map(PyMatchedAddress::from);
+        if matched.is_some() {
+            self.index += 1;
+        }
+        Ok(matched)
+    }
+}
+
 /// Convert Rust Value to f64 for Python
 fn value_to_f64(value: &Value) -> f64 {
     match value {
@@ -154,8 +197,12 @@ fn query_system_info() -> PySystemInfo {
 
 /// Get process module regions
 #[pyfunction]
-fn get_process_module_regions(handle: &PyProcessHandle) -> PyResult<Vec<PyMemoryRegion>> {
-    let regions = process::get_process_module_regions(&handle.handle)
+fn get_process_module_regions(
+    py: Python<'_>,
+    handle: &PyProcessHandle,
+) -> PyResult<Vec<PyMemoryRegion>> {
+    let regions = py
+        .allow_threads(|| process::get_process_module_regions(&handle.handle))
         .map_err(|e| PyRuntimeError::new_err(format!("Failed to get module regions: {}", e)))?;
 
     Ok(regions
@@ -177,28 +224,59 @@ fn parse_hex_pattern(pattern: &str) -> PyResult<Vec<u8>> {
         .map_err(|e| PyValueError::new_err(format!("Invalid hex pattern: {}", e)))
 }
 
+/// Parse a hex pattern with "??" wildcards into (bytes, mask)
+#[pyfunction]
+fn parse_hex_pattern_masked<'py>(
+    py: Python<'py>,
+    pattern: &str,
+) -> PyResult<(Bound<'py, PyBytes>, Bound<'py, PyBytes>)> {
+    let (bytes, mask) = libmemscan::parse_hex_pattern_masked(pattern)
+        .map_err(|e| PyValueError::new_err(format!("Invalid hex pattern: {}", e)))?;
+    Ok((
+        PyBytes::new_bound(py, &bytes),
+        PyBytes::new_bound(py, &mask),
+    ))
+}
+
 /// Read memory from a process at a specific address
+///
+/// The memory is read directly into the returned bytearray, without an
+/// intermediate Rust buffer. The GIL is released during the read; the new
+/// bytearray is not reachable from other threads until it is returned.
 #[pyfunction]
-fn read_process_memory(handle: &PyProcessHandle, address: usize, size: usize) -> PyResult<Vec<u8>> {
-    let mut buffer = vec![0u8; size];
-    let bytes_read = process::read_process_memory(&handle.handle, address, &mut buffer);
+fn read_process_memory<'py>(
+    py: Python<'py>,
+    handle: &PyProcessHandle,
+    address: usize,
+    size: usize,
+) -> PyResult<Bound<'py, PyByteArray>> {
+    let mut bytes_read = 0;
+    let buffer = PyByteArray::new_bound_with(py, size, |buf| {
+        bytes_read =
+            py.allow_threads(|| process::read_process_memory(&handle.handle, address, buf));
+        Ok(())
+    })?;
 
     if bytes_read == 0 {
         return Err(PyRuntimeError::new_err("Failed to read process memory"));
     }
 
-    buffer.truncate(bytes_read);
+    if bytes_read < size {
+        buffer.resize(bytes_read)?;
+    }
     Ok(buffer)
 }
 
 /// Write memory to a process at a specific address
 #[pyfunction]
 fn write_process_memory(
+    py: Python<'_>,
     handle: &PyProcessHandle,
     address: usize,
     data: Vec<u8>,
 ) -> PyResult<usize> {
-    let bytes_written = process::write_process_memory(&handle.handle, address, &data);
+    let bytes_written =
+        py.allow_threads(|| process::write_process_memory(&handle.handle, address, &data));
 
     if bytes_written == 0 {
         return Err(PyRuntimeError::new_err("Failed to write process memory"));
@@ -210,6 +288,7 @@ fn write_process_memory(
 /// Create an interactive scanner for a process
 #[pyfunction]
 fn create_interactive_scanner(
+    py: Python<'_>,
     handle: &PyProcessHandle,
     regions: Vec<PyMemoryRegion>,
     value_type: &str,
@@ -265,10 +344,11 @@ fn create_interactive_scanner(
 
     // SAFETY: We extend the lifetime of the reference here
     // This is safe because we control both lifetimes through Python's ownership
-    let scanner = unsafe {
-        let process_ref = &*process_ptr;
-        InteractiveScanner::new(process_ref, rust_regions, vtype)
-    };
+    let process_ref: &'static ProcessHandle = unsafe { &*process_ptr };
+
+    // Mapping the regions reads them all from the target, so let other
+    // Python threads run meanwhile
+    let scanner = py.allow_threads(|| InteractiveScanner::new(process_ref, rust_regions, vtype));
 
     Ok(PyInteractiveScanner {
         scanner: Some(scanner),
@@ -278,6 +358,26 @@ fn create_interactive_scanner(
     })
 }
 
+/// Helper to convert a Python number to Value based on ValueType
+///
+/// Integer types first try to extract an int directly, so 64-bit values keep
+/// full precision. Anything else (floats, out-of-range ints, NumPy floats,
+/// `Decimal`, ...) goes through [`f64_to_value`].
+fn py_to_value(value: &Bound<'_, PyAny>, vtype: ValueType) -> PyResult<Value> {
+    let int = match vtype {
+        ValueType::I8 => value.extract().map(Value::I8),
+        ValueType::I16 => value.extract().map(Value::I16),
+        ValueType::I32 => value.extract().map(Value::I32),
+        ValueType::I64 => value.extract().map(Value::I64),
+        ValueType::U8 => value.extract().map(Value::U8),
+        ValueType::U16 => value.extract().map(Value::U16),
+        ValueType::U32 => value.extract().map(Value::U32),
+        ValueType::U64 => value.extract().map(Value::U64),
+        ValueType::F32 | ValueType::F64 => return Ok(f64_to_value(value.extract()?, vtype)),
+    };
+    int.or_else(|_| value.extract().map(|f| f64_to_value(f, vtype)))
+}
+
 /// Helper to convert f64 to Value based on ValueType
 fn f64_to_value(f: f64, vtype: ValueType) -> Value {
     match vtype {
@@ -297,120 +397,180 @@ fn f64_to_value(f: f64, vtype: ValueType) -> Value {
 #[pymethods]
 impl PyInteractiveScanner {
     /// Perform initial scan to find all possible addresses
-    fn initial_scan(&mut self) -> PyResult<usize> {
+    fn initial_scan(&mut self, py: Python<'_>) -> PyResult<usize> {
+        let scanner = self
+            .scanner
+            .as_mut()
+            .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
+
+        py.allow_threads(|| scanner.initial_scan())
+            .map_err(|e| PyRuntimeError::new_err(format!("Initial scan failed: {}", e)))
+    }
+
+    /// Perform initial scan keeping only addresses that hold the given value
+    fn initial_scan_eq(&mut self, py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        scanner
-            .initial_scan()
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.initial_scan_eq(val))
             .map_err(|e| PyRuntimeError::new_err(format!("Initial scan failed: {}", e)))
     }
 
     /// Filter addresses by value equality
-    fn filter_eq(&mut self, value: f64) -> PyResult<usize> {
+    fn filter_eq(&mut self, py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .filter(FilterOp::Equals, Some(val))
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.filter(FilterOp::Equals, Some(val)))
             .map_err(|e| PyRuntimeError::new_err(format!("Filter failed: {}", e)))
     }
 
     /// Filter addresses by value less than
-    fn filter_lt(&mut self, value: f64) -> PyResult<usize> {
+    fn filter_lt(&mut self, py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .filter(FilterOp::LessThan, Some(val))
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.filter(FilterOp::LessThan, Some(val)))
             .map_err(|e| PyRuntimeError::new_err(format!("Filter failed: {}", e)))
     }
 
     /// Filter addresses by value greater than
-    fn filter_gt(&mut self, value: f64) -> PyResult<usize> {
+    fn filter_gt(&mut self, py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .filter(FilterOp::GreaterThan, Some(val))
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.filter(FilterOp::GreaterThan, Some(val)))
             .map_err(|e| PyRuntimeError::new_err(format!("Filter failed: {}", e)))
     }
 
     /// Filter addresses where value increased
-    fn filter_increased(&mut self) -> PyResult<usize> {
+    fn filter_increased(&mut self, py: Python<'_>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        scanner
-            .filter(FilterOp::Increased, None)
+        py.allow_threads(|| scanner.filter(FilterOp::Increased, None))
             .map_err(|e| PyRuntimeError::new_err(format!("Filter failed: {}", e)))
     }
 
     /// Filter addresses where value decreased
-    fn filter_decreased(&mut self) -> PyResult<usize> {
+    fn filter_decreased(&mut self, py: Python<'_>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        scanner
-            .filter(FilterOp::Decreased, None)
+        py.allow_threads(|| scanner.filter(FilterOp::Decreased, None))
             .map_err(|e| PyRuntimeError::new_err(format!("Filter failed: {}", e)))
     }
 
     /// Filter addresses where value changed
-    fn filter_changed(&mut self) -> PyResult<usize> {
+    fn filter_changed(&mut self, py: Python<'_>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        scanner
-            .filter(FilterOp::Changed, None)
+        py.allow_threads(|| scanner.filter(FilterOp::Changed, None))
             .map_err(|e| PyRuntimeError::new_err(format!("Filter failed: {}", e)))
     }
 
     /// Filter addresses where value unchanged
-    fn filter_unchanged(&mut self) -> PyResult<usize> {
+    fn filter_unchanged(&mut self, py: Python<'_>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        scanner
-            .filter(FilterOp::Unchanged, None)
+        py.allow_threads(|| scanner.filter(FilterOp::Unchanged, None))
             .map_err(|e| PyRuntimeError::new_err(format!("Filter failed: {}", e)))
     }
 
     /// Get list of matched addresses
-    fn get_matches(&self) -> PyResult<Vec<PyMatchedAddress>> {
+    fn get_matches(&self, py: Python<'_>) -> PyResult<Vec<PyMatchedAddress>> {
         let scanner = self
             .scanner
             .as_ref()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let matches = scanner.matches();
-        Ok(matches
-            .iter()
-            .map(|m| PyMatchedAddress {
-                address: m.address,
-                current_value: value_to_f64(&m.current_value),
-                previous_value: m.previous_value.as_ref().map(value_to_f64),
-            })
-            .collect())
+        Ok(py.allow_threads(|| scanner.matches().map(PyMatchedAddress::from).collect()))
+    }
+
+    /// Iterate over the matched addresses without building the whole list
+    fn iter_matches(slf: Py<Self>) -> PyMatchIter {
+        PyMatchIter {
+            scanner: slf,
+            index: 0,
+        }
+    }
+
+    /// Get the addresses of all matches as packed little-endian u64 bytes
+    fn addresses_buffer<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let scanner = self
+            .scanner
+            .as_ref()
+            .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
+
+        let addresses = scanner.match_addresses();
+        PyBytes::new_bound_with(py, addresses.len() * 8, |buf| {
+            for (slot, &address) in buf.chunks_exact_mut(8).zip(addresses) {
+                slot.copy_from_slice(&(address as u64).to_le_bytes());
+            }
+            Ok(())
+        })
+    }
+
+    /// Value type the scanner was created for (e.g. "i32")
+    #[getter]
+    fn value_type(&self) -> String {
+        format!("{:?}", self.value_type).to_lowercase()
+    }
+
+    /// Get the current values of all matches as packed little-endian bytes
+    fn match_values_buffer<'py>(&mut self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let scanner = self
+            .scanner
+            .as_mut()
+            .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
+
+        let packed = py.allow_threads(|| scanner.current_values_packed());
+        Ok(PyBytes::new_bound(py, &packed))
+    }
+
+    /// Get the values recorded by the last scan/filter step as packed little-endian bytes
+    fn scanned_values_buffer<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let scanner = self
+            .scanner
+            .as_ref()
+            .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
+
+        let packed = py.allow_threads(|| scanner.scanned_values_packed());
+        Ok(PyBytes::new_bound(py, &packed))
+    }
+
+    /// Keep only the matches at the given (uint32) indices
+    fn apply_index_mask(&mut self, py: Python<'_>, indices: PyBuffer<u32>) -> PyResult<usize> {
+        let scanner = self
+            .scanner
+            .as_mut()
+            .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
+
+        let indices = indices.to_vec(py)?;
+        py.allow_threads(|| scanner.retain_indices(&indices))
+            .map_err(|e| PyValueError::new_err(format!("Apply index mask failed: {}", e)))
     }
 
     /// Get number of matched addresses
@@ -420,96 +580,105 @@ impl PyInteractiveScanner {
             .as_ref()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        Ok(scanner.matches().len())
+        Ok(scanner.match_count())
     }
 
-    /// Set value at all matched addresses
-    fn set_value(&mut self, value: f64) -> PyResult<usize> {
+    /// Set value at all matched addresses, or only at the matches with the given indices
+    #[pyo3(signature = (value, indices=None))]
+    fn set_value(
+        &mut self,
+        py: Python<'_>,
+        value: &Bound<'_, PyAny>,
+        indices: Option<Vec<usize>>,
+    ) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .write_all(val)
-            .map_err(|e| PyRuntimeError::new_err(format!("Set value failed: {}", e)))
+        let val = py_to_value(value, self.value_type)?;
+        let scanner = &*scanner;
+        py.allow_threads(|| match indices {
+            Some(indices) => scanner.write_indices(&indices, val),
+            None => scanner.write_all(val),
+        })
+        .map_err(|e| PyRuntimeError::new_err(format!("Set value failed: {}", e)))
     }
 
     /// Set value at a specific address
-    fn set_value_at(&mut self, address: usize, value: f64) -> PyResult<()> {
+    fn set_value_at(
+        &mut self,
+        py: Python<'_>,
+        address: usize,
+        value: &Bound<'_, PyAny>,
+    ) -> PyResult<()> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .write_value(address, val)
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.write_value(address, val))
             .map_err(|e| PyRuntimeError::new_err(format!("Set value failed: {}", e)))
     }
 
     /// Add value to all matched addresses
-    fn add_value(&mut self, value: f64) -> PyResult<usize> {
+    fn add_value(&mut self, py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .modify_all(MathOp::Add, val)
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.modify_all(MathOp::Add, val))
             .map_err(|e| PyRuntimeError::new_err(format!("Math operation failed: {}", e)))
     }
 
     /// Subtract value from all matched addresses
-    fn sub_value(&mut self, value: f64) -> PyResult<usize> {
+    fn sub_value(&mut self, py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .modify_all(MathOp::Subtract, val)
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.modify_all(MathOp::Subtract, val))
             .map_err(|e| PyRuntimeError::new_err(format!("Math operation failed: {}", e)))
     }
 
     /// Multiply value at all matched addresses
-    fn mul_value(&mut self, value: f64) -> PyResult<usize> {
+    fn mul_value(&mut self, py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .modify_all(MathOp::Multiply, val)
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.modify_all(MathOp::Multiply, val))
             .map_err(|e| PyRuntimeError::new_err(format!("Math operation failed: {}", e)))
     }
 
     /// Divide value at all matched addresses
-    fn div_value(&mut self, value: f64) -> PyResult<usize> {
+    fn div_value(&mut self, py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<usize> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        let val = f64_to_value(value, self.value_type);
-        scanner
-            .modify_all(MathOp::Divide, val)
+        let val = py_to_value(value, self.value_type)?;
+        py.allow_threads(|| scanner.modify_all(MathOp::Divide, val))
             .map_err(|e| PyRuntimeError::new_err(format!("Math operation failed: {}", e)))
     }
 
     /// Save a checkpoint with a given name
-    fn save_checkpoint(&mut self, name: &str) -> PyResult<()> {
+    fn save_checkpoint(&mut self, py: Python<'_>, name: &str) -> PyResult<()> {
         let scanner = self
             .scanner
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        scanner
-            .save_checkpoint(name.to_string())
+        let name = name.to_string();
+        py.allow_threads(|| scanner.save_checkpoint(name))
             .map_err(|e| PyRuntimeError::new_err(format!("Save checkpoint failed: {}", e)))
     }
 
@@ -547,6 +716,7 @@ impl PyInteractiveScanner {
     /// Filter by relative checkpoint changes
     fn filter_checkpoint(
         &mut self,
+        py: Python<'_>,
         cp1: &str,
         cp2: &str,
         cp3: &str,
@@ -557,8 +727,7 @@ impl PyInteractiveScanner {
             .as_mut()
             .ok_or_else(|| PyRuntimeError::new_err("Scanner not initialized"))?;
 
-        scanner
-            .filter_checkpoint_relative(cp1, cp2, cp3, margin)
+        py.allow_threads(|| scanner.filter_checkpoint_relative(cp1, cp2, cp3, margin))
             .map_err(|e| PyRuntimeError::new_err(format!("Checkpoint filter failed: {}", e)))
     }
 }
@@ -571,6 +740,7 @@ fn memscan(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(query_system_info, m)?)?;
     m.add_function(wrap_pyfunction!(get_process_module_regions, m)?)?;
     m.add_function(wrap_pyfunction!(parse_hex_pattern, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_hex_pattern_masked, m)?)?;
     m.add_function(wrap_pyfunction!(read_process_memory, m)?)?;
     m.add_function(wrap_pyfunction!(write_process_memory, m)?)?;
     m.add_function(wrap_pyfunction!(create_interactive_scanner, m)?)?;
@@ -580,6 +750,7 @@ fn memscan(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PySystemInfo>()?;
     m.add_class::<PyInteractiveScanner>()?;
     m.add_class::<PyMatchedAddress>()?;
+    m.add_class::<PyMatchIter>()?;
 
     Ok(())
 }
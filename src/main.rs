@@ -1,6 +1,6 @@
 use clap::{Parser, Subcommand, ValueHint, builder::styling::AnsiColor};
 use libmemscan::{
-    parse_hex_pattern,
+    parse_hex_pattern_masked,
     process::{find_process_by_name, get_process_module_regions, open_process, query_system_info},
     scanner::{ScanOptions, scan_process},
     values::ValueType,
@@ -41,7 +41,7 @@ pub enum Command {
         /// Target process executable name or id (e.g. "notepad", "notepad.exe", or 1234)
         target: String,
 
-        /// Optional hex pattern to search for (e.g. "DEADBEEF")
+        /// Optional hex pattern to search for (e.g. "DEADBEEF" or "4D ?? 90 00")
         #[arg(short, long, value_hint = ValueHint::Other)]
         pattern: Option<String>,
 
@@ -95,7 +95,11 @@ fn main() -> anyhow::Result<()> {
                 modules.len()
             );
 
-            let Some(pattern) = pattern.as_ref().map(|s| parse_hex_pattern(s)).transpose()? else {
+            let Some((pattern, mask)) = pattern
+                .as_ref()
+                .map(|s| parse_hex_pattern_masked(s))
+                .transpose()?
+            else {
                 anyhow::bail!("a hex pattern must be specified for scanning");
             };
 
@@ -104,7 +108,7 @@ fn main() -> anyhow::Result<()> {
                 all_modules,
             };
 
-            scan_process(&proc, &sys, &pattern, &opts, &modules)?;
+            scan_process(&proc, &sys, &pattern, &mask, &opts, &modules)?;
         }
         Command::Interactive {
             target,
@@ -289,11 +289,11 @@ impl<'a> Repl<'a> {
     }
 
     fn list_matches(&self) -> Result<()> {
-        let matches = self.scanner.matches();
-        println!("{} matches found", matches.len().to_string().bright_green());
+        let match_count = self.scanner.match_count();
+        println!("{} matches found", match_count.to_string().bright_green());
 
-        let display_count = matches.len().min(20);
-        for (i, m) in matches.iter().take(display_count).enumerate() {
+        let display_count = match_count.min(20);
+        for (i, m) in self.scanner.matches().take(display_count).enumerate() {
             let value_str = format_value(&m.current_value);
             let prev_str = m
                 .previous_value
@@ -309,11 +309,11 @@ impl<'a> Repl<'a> {
             );
         }
 
-        if matches.len() > display_count {
+        if match_count > display_count {
             println!(
                 "  {} ... and {} more",
                 "[...]".bright_black(),
-                (matches.len() - display_count).to_string().bright_black()
+                (match_count - display_count).to_string().bright_black()
             );
         }
 
@@ -338,7 +338,7 @@ impl<'a> Repl<'a> {
                 .parse()
                 .map_err(|_| anyhow::anyhow!("Invalid margin value: {}", args[4]))?;
 
-            let before = self.scanner.matches().len();
+            let before = self.scanner.match_count();
             let after = self
                 .scanner
                 .filter_checkpoint_relative(cp1, cp2, cp3, margin)?;
@@ -389,7 +389,7 @@ impl<'a> Repl<'a> {
             _ => anyhow::bail!("Unknown filter operation: {}", args[0]),
         };
 
-        let before = self.scanner.matches().len();
+        let before = self.scanner.match_count();
         let after = self.scanner.filter(op, compare_value)?;
 
         println!(